@@ -60,12 +60,19 @@ from mcp_http_client import (
     get_mcp_http_client,
     close_mcp_http_client,
 )
-from scheduler import init_scheduler, start_scheduler, stop_scheduler, get_scheduler
+from scheduler import (
+    init_scheduler,
+    start_scheduler,
+    stop_scheduler,
+    get_scheduler,
+    invalidate_email_prefs,
+)
 from yandex_calendar import (
     init_yandex_calendar,
     is_calendar_enabled,
     add_task_to_calendar,
     delete_task_from_calendar,
+    close_yandex_calendar,
 )
 
 # Настройка логирования
@@ -1475,17 +1482,11 @@ async def task_done_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             )
             return
 
-        # Get task title first (for calendar deletion)
-        task_title = None
-        task_info = await client.get_task(user_id=str(user.id), task_id=task_id)
-        if task_info.success and task_info.data:
-            task_data = task_info.data.get("task", {})
-            task_title = task_data.get("title")
-
-        # Call MCP tool to complete task
+        # Call MCP tool to complete task (returns the title for calendar deletion)
         result = await client.complete_task(user_id=str(user.id), task_id=task_id)
 
         if result.success and result.data:
+            task_title = result.data.get("title")
             message = f"Task completed: **{task_title or task_id}**"
 
             # Delete from Yandex Calendar if enabled (with timeout)
@@ -1895,6 +1896,7 @@ async def email_decision_callback(update: Update, context: ContextTypes.DEFAULT_
             mcp = get_mcp_http_client()
             if mcp:
                 await mcp.set_email_preferences(user_id, email_enabled=False)
+        invalidate_email_prefs(user_id)
 
         await query.edit_message_text(
             "Email notifications **disabled**.\n\n"
@@ -1951,6 +1953,7 @@ async def email_address_received(update: Update, context: ContextTypes.DEFAULT_T
                 "email_enabled": True,
                 "email_recipient": email
             })
+    invalidate_email_prefs(user_id)
 
     await update.message.reply_text(
         f"Email notifications **enabled**!\n\n"
@@ -2178,6 +2181,7 @@ def main() -> None:
         scheduler.stop()
         if USE_HTTP_MCP:
             await close_mcp_http_client()
+        close_yandex_calendar()
         logger.info("Cleanup completed")
 
     application.post_init = post_init
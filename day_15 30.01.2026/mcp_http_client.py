@@ -26,6 +26,10 @@ logger = logging.getLogger(__name__)
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8080")
 MCP_TIMEOUT = int(os.getenv("MCP_TIMEOUT", "30"))
 MCP_MAX_RETRIES = int(os.getenv("MCP_MAX_RETRIES", "3"))
+MCP_POOL_SIZE = int(os.getenv("MCP_POOL_SIZE", "20"))
+# Idle connections outlive the scheduler's one-minute tick, but stay under the
+# aiohttp server's 75s keep-alive so the server never closes one first
+MCP_KEEPALIVE_TIMEOUT = 60
 
 
 @dataclass
@@ -72,7 +76,12 @@ class MCPHttpClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            connector = aiohttp.TCPConnector(
+                limit=MCP_POOL_SIZE,
+                limit_per_host=MCP_POOL_SIZE,
+                keepalive_timeout=MCP_KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
         return self._session
 
     async def close(self) -> None:
@@ -237,6 +246,10 @@ class MCPHttpClient:
             args["description"] = description
         return await self.call_tool("task_create", args)
 
+    async def create_tasks_bulk(self, user_id: str, tasks: list[dict]) -> MCPResult:
+        """Create several tasks in one call."""
+        return await self.call_tool("task_create_bulk", {"user_id": user_id, "tasks": tasks})
+
     async def list_open_tasks(self, user_id: str) -> MCPResult:
         """List all open tasks for a user."""
         return await self.call_tool("task_list_open", {"user_id": user_id})
@@ -264,6 +277,14 @@ class MCPHttpClient:
             "include_completed": include_completed
         })
 
+    async def generate_summaries(self, user_ids: list[str],
+                                 include_completed: bool = False) -> MCPResult:
+        """Generate task summaries for several users in one call."""
+        return await self.call_tool("reminder_generate_summaries", {
+            "user_ids": user_ids,
+            "include_completed": include_completed
+        })
+
     async def get_reminder_preferences(self, user_id: str) -> MCPResult:
         """Get reminder preferences for a user."""
         return await self.call_tool("reminder_get_preferences", {"user_id": user_id})
@@ -278,6 +299,10 @@ class MCPHttpClient:
             "minute": minute
         })
 
+    async def set_preferences_bulk(self, preferences: list[dict]) -> MCPResult:
+        """Set reminder and email preferences for several users in one call."""
+        return await self.call_tool("reminder_set_preferences_bulk", {"preferences": preferences})
+
     async def get_scheduled_users(self, hour: int, minute: int) -> MCPResult:
         """Get users scheduled for reminder at given time."""
         return await self.call_tool("reminder_get_scheduled_users", {
@@ -289,6 +314,21 @@ class MCPHttpClient:
         """Mark that a reminder was sent."""
         return await self.call_tool("reminder_mark_sent", {"user_id": user_id})
 
+    async def mark_reminders_sent(self, user_ids: list[str]) -> MCPResult:
+        """Mark that reminders were sent to several users."""
+        return await self.call_tool("reminder_mark_sent_bulk", {"user_ids": user_ids})
+
+    async def run_reminder_batch(self, hour: int, minute: int,
+                                 include_completed: bool = False,
+                                 send_email: bool = True) -> MCPResult:
+        """Build all summaries for a schedule slot and queue their emails."""
+        return await self.call_tool("reminder_run_batch", {
+            "hour": hour,
+            "minute": minute,
+            "include_completed": include_completed,
+            "send_email": send_email
+        })
+
     # ==========================================================================
     # Convenience methods for Email Notifications
     # ==========================================================================
@@ -312,6 +352,25 @@ class MCPHttpClient:
             "message_text": message_text
         })
 
+    async def queue_email(self, recipient_email: str, subject: str,
+                          message_text: str) -> MCPResult:
+        """
+        Queue an email notification without waiting for SMTP delivery.
+
+        Args:
+            recipient_email: Recipient email address
+            subject: Email subject
+            message_text: Email body text
+
+        Returns:
+            MCPResult with success status (delivery happens in the background)
+        """
+        return await self.call_tool("notification_queue_email", {
+            "recipient_email": recipient_email,
+            "subject": subject,
+            "message_text": message_text
+        })
+
     async def set_email_preferences(self, user_id: str, email_enabled: bool,
                                    email_recipient: Optional[str] = None) -> MCPResult:
         """
@@ -334,6 +393,10 @@ class MCPHttpClient:
         """Get email notification preferences for a user."""
         return await self.call_tool("notification_get_email_preferences", {"user_id": user_id})
 
+    async def get_email_preferences_bulk(self, user_ids: list[str]) -> MCPResult:
+        """Get email notification preferences for several users."""
+        return await self.call_tool("notification_get_email_preferences_bulk", {"user_ids": user_ids})
+
     async def validate_email(self, email: str) -> MCPResult:
         """Validate an email address format."""
         return await self.call_tool("notification_validate_email", {"email": email})
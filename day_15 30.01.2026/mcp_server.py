@@ -3,7 +3,7 @@
 MCP Server for Kubernetes deployment.
 
 A production-ready MCP server that exposes:
-- Task Tracker tools (create, list, count, complete)
+- Task Tracker tools (create, bulk create, list, count, complete)
 - Reminder tool (generate_summary)
 
 Uses HTTP/SSE transport for Kubernetes inter-pod communication.
@@ -19,24 +19,56 @@ Environment variables:
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
 import re
+import signal
 import smtplib
 import sqlite3
 import ssl
-from contextlib import contextmanager
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Literal, Optional, Union
 
 from aiohttp import web
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,6 +81,12 @@ HOST = os.getenv("MCP_SERVER_HOST", "0.0.0.0")
 PORT = int(os.getenv("MCP_SERVER_PORT", "8080"))
 DATA_DIR = Path(os.getenv("DATA_DIR", "/data"))
 
+# Worker threads for blocking tool handlers (I/O bound, so not tied to CPU count)
+MCP_WORKERS = int(os.getenv("MCP_WORKERS", "10"))
+
+# Server processes sharing PORT through SO_REUSEPORT (POSIX only)
+SERVER_PROCESSES = int(os.getenv("MCP_SERVER_PROCESSES", "1"))
+
 # SMTP Configuration from environment (default: Yandex Mail)
 SMTP_HOST = os.getenv("SMTP_HOST", "smtp.yandex.ru")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
@@ -69,8 +107,153 @@ if not SMTP_USER or not SMTP_PASSWORD:
     except ImportError:
         pass  # Config not available, use environment variables only
 
+
+@dataclass(frozen=True, slots=True)
+class SMTPConfig:
+    """SMTP settings resolved once at startup."""
+    host: str
+    port: int
+    user: str
+    password: str
+    from_email: str
+    use_tls: bool
+    configured: bool
+
+
+SMTP_CONFIG = SMTPConfig(
+    host=SMTP_HOST,
+    port=SMTP_PORT,
+    user=SMTP_USER,
+    password=SMTP_PASSWORD,
+    from_email=SMTP_FROM_EMAIL,
+    use_tls=SMTP_USE_TLS,
+    configured=bool(SMTP_HOST and SMTP_USER and SMTP_PASSWORD and SMTP_FROM_EMAIL)
+)
+
 # Database path
 DB_PATH = DATA_DIR / "tasks.db"
+DB_PATH_STR = str(DB_PATH)
+
+# Memory-mapped I/O window (256 MiB) and page cache (64 MiB, negative = KiB)
+DB_MMAP_SIZE = 256 * 1024 * 1024
+DB_CACHE_SIZE_KIB = 64 * 1024
+
+# Bump together with a new migration step in init_database
+SCHEMA_VERSION = 1
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+DB_CACHED_STATEMENTS = 256
+
+# Queries on the per-minute scheduler and summary paths
+SQL_LIST_OPEN_TASKS = """
+    SELECT id, title, description, priority, created_at
+    FROM tasks
+    WHERE user_id = ? AND status = 'open'
+    ORDER BY
+        CASE priority
+            WHEN 'high' THEN 1
+            WHEN 'normal' THEN 2
+            WHEN 'low' THEN 3
+        END,
+        created_at DESC
+"""
+SQL_LIST_COMPLETED_TASKS = """
+    SELECT id, title, description, completed_at
+    FROM tasks
+    WHERE user_id = ? AND status = 'completed'
+    ORDER BY completed_at DESC
+    LIMIT ?
+"""
+# Open tasks (priority order) and recently completed tasks in one round-trip
+SQL_SUMMARY_TASKS = """
+    SELECT 'open' AS bucket, title, description, priority,
+        CASE priority
+            WHEN 'high' THEN 1
+            WHEN 'normal' THEN 2
+            WHEN 'low' THEN 3
+        END AS priority_rank,
+        created_at AS sort_time
+    FROM tasks
+    WHERE user_id = ? AND status = 'open'
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'completed', title, description, priority, NULL, completed_at
+        FROM tasks
+        WHERE user_id = ? AND status = 'completed'
+        ORDER BY completed_at DESC
+        LIMIT ?
+    )
+    ORDER BY bucket DESC, priority_rank, sort_time DESC
+"""
+# Same buckets as SQL_SUMMARY_TASKS for a cohort of users, folded by SQLite
+# into one row per user with JSON arrays of open and completed tasks. {users}
+# is a placeholder list; completed tasks are limited per user. json_group_array
+# has no defined order before SQLite 3.44, so each task carries its position
+# from a window function and the caller sorts on it.
+SQL_SUMMARY_TASKS_BULK = """
+    SELECT user_id,
+        json_group_array(
+            json_object('title', title, 'description', description,
+                        'priority', priority, 'position', position)
+        ) FILTER (WHERE bucket = 'open') AS open_tasks,
+        json_group_array(json_object('title', title, 'position', position))
+            FILTER (WHERE bucket = 'completed') AS completed_tasks
+    FROM (
+        SELECT user_id, 'open' AS bucket, title, description, priority,
+            ROW_NUMBER() OVER (
+                PARTITION BY user_id
+                ORDER BY
+                    CASE priority
+                        WHEN 'high' THEN 1
+                        WHEN 'normal' THEN 2
+                        WHEN 'low' THEN 3
+                    END,
+                    created_at DESC
+            ) AS position
+        FROM tasks
+        WHERE user_id IN ({users}) AND status = 'open'
+        UNION ALL
+        SELECT user_id, 'completed', title, description, priority, position
+        FROM (
+            SELECT user_id, title, description, priority,
+                ROW_NUMBER() OVER (
+                    PARTITION BY user_id ORDER BY completed_at DESC
+                ) AS position
+            FROM tasks
+            WHERE user_id IN ({users}) AND status = 'completed'
+        )
+        WHERE position <= ?
+    )
+    GROUP BY user_id
+"""
+# Full preferences row upsert; schedule and email settings in one statement
+SQL_UPSERT_PREFERENCES = """
+    INSERT INTO reminder_preferences
+        (user_id, enabled, schedule_hour, schedule_minute, email_enabled, email_recipient)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        enabled = excluded.enabled,
+        schedule_hour = excluded.schedule_hour,
+        schedule_minute = excluded.schedule_minute,
+        email_enabled = excluded.email_enabled,
+        email_recipient = excluded.email_recipient
+"""
+# Users per bulk summary query, keeps both IN lists under SQLite's variable limit
+SUMMARY_BATCH_SIZE = 400
+SQL_USERS_FOR_REMINDER = """
+    SELECT user_id FROM reminder_preferences
+    WHERE enabled = 1 AND schedule_hour = ? AND schedule_minute = ?
+"""
+SQL_REMINDER_RECIPIENTS = """
+    SELECT user_id, email_enabled, email_recipient FROM reminder_preferences
+    WHERE enabled = 1 AND schedule_hour = ? AND schedule_minute = ?
+"""
+# Users per bulk email preferences query, under SQLite's variable limit
+EMAIL_PREFS_BATCH_SIZE = 900
+SQL_EMAIL_PREFS_BULK = """
+    SELECT user_id, email_enabled, email_recipient FROM reminder_preferences
+    WHERE user_id IN ({users})
+"""
 
 
 # =============================================================================
@@ -101,6 +284,68 @@ def init_database() -> None:
             CREATE INDEX IF NOT EXISTS idx_tasks_user_status
             ON tasks(user_id, status)
         """)
+        # Recently-completed lookups read the newest rows of this index and
+        # stop at the LIMIT instead of sorting the user's whole history
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_completed_user
+            ON tasks(user_id, completed_at) WHERE status = 'completed'
+        """)
+        # Open tasks in SQL_LIST_OPEN_TASKS order, so listing walks the index
+        # instead of sorting; the CASE must match the query's ORDER BY exactly
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_open_priority
+            ON tasks(
+                user_id,
+                (CASE priority WHEN 'high' THEN 1 WHEN 'normal' THEN 2 WHEN 'low' THEN 3 END),
+                created_at DESC
+            ) WHERE status = 'open'
+        """)
+
+        # Open task counter per user, kept in step with tasks by triggers so
+        # get_open_count is a primary-key lookup instead of a COUNT(*)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS task_counts (
+                user_id TEXT PRIMARY KEY,
+                open_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_count_insert
+            AFTER INSERT ON tasks
+            WHEN NEW.status = 'open'
+            BEGIN
+                INSERT INTO task_counts (user_id, open_count) VALUES (NEW.user_id, 1)
+                ON CONFLICT(user_id) DO UPDATE SET open_count = open_count + 1;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_count_update
+            AFTER UPDATE OF status, user_id ON tasks
+            WHEN (OLD.status = 'open') <> (NEW.status = 'open') OR OLD.user_id <> NEW.user_id
+            BEGIN
+                UPDATE task_counts SET open_count = open_count - 1
+                WHERE user_id = OLD.user_id AND OLD.status = 'open';
+                INSERT INTO task_counts (user_id, open_count)
+                SELECT NEW.user_id, 1 WHERE NEW.status = 'open'
+                ON CONFLICT(user_id) DO UPDATE SET open_count = open_count + 1;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_count_delete
+            AFTER DELETE ON tasks
+            WHEN OLD.status = 'open'
+            BEGIN
+                UPDATE task_counts SET open_count = open_count - 1
+                WHERE user_id = OLD.user_id;
+            END
+        """)
+        # Rebuild counters from tasks so databases created before the triggers
+        # (or edited by hand) start out correct
+        conn.execute("DELETE FROM task_counts")
+        conn.execute("""
+            INSERT INTO task_counts (user_id, open_count)
+            SELECT user_id, COUNT(*) FROM tasks WHERE status = 'open' GROUP BY user_id
+        """)
 
         # Reminder preferences table
         conn.execute("""
@@ -116,28 +361,85 @@ def init_database() -> None:
             )
         """)
 
-        # Migration: Add email columns if they don't exist (for existing databases)
-        try:
-            conn.execute("ALTER TABLE reminder_preferences ADD COLUMN email_enabled INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        try:
-            conn.execute("ALTER TABLE reminder_preferences ADD COLUMN email_recipient TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        # Per-minute scheduler lookup: only opted-in users, user_id for a covering read
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_prefs_schedule
+            ON reminder_preferences(schedule_hour, schedule_minute, user_id)
+            WHERE enabled = 1
+        """)
+
+        # Migrations, tracked in PRAGMA user_version so each runs only once
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # v1: email columns on databases created before email support
+            columns = {
+                row["name"]
+                for row in conn.execute("PRAGMA table_info(reminder_preferences)")
+            }
+            if "email_enabled" not in columns:
+                conn.execute("ALTER TABLE reminder_preferences ADD COLUMN email_enabled INTEGER DEFAULT 0")
+            if "email_recipient" not in columns:
+                conn.execute("ALTER TABLE reminder_preferences ADD COLUMN email_recipient TEXT")
+        if version < SCHEMA_VERSION:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
+
+        # WAL lets readers run alongside writes; the mode is stored in the file
+        conn.execute("PRAGMA journal_mode = WAL")
     logger.info(f"Database initialized at {DB_PATH}")
 
 
+# One long-lived connection per thread, opened on first use
+_thread_conns = threading.local()
+
+
+def _get_thread_connection() -> sqlite3.Connection:
+    """Get the calling thread's database connection, opening it if needed."""
+    conn = getattr(_thread_conns, "conn", None)
+    if conn is None:
+        # Connections are long-lived, so a larger statement cache keeps every
+        # query in this module prepared after its first use
+        conn = sqlite3.connect(
+            DB_PATH_STR,
+            check_same_thread=False,
+            cached_statements=DB_CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row
+        # Safe with WAL: a crash can lose the last commits but not corrupt the DB
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = -{DB_CACHE_SIZE_KIB}")
+        _thread_conns.conn = conn
+    return conn
+
+
+def _close_thread_connection() -> None:
+    """Close the calling thread's database connection, if it has one."""
+    conn = getattr(_thread_conns, "conn", None)
+    if conn is not None:
+        conn.close()
+        _thread_conns.conn = None
+
+
 @contextmanager
 def get_db_connection():
     """Context manager for database connections."""
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
+    conn = _get_thread_connection()
     try:
         yield conn
     finally:
-        conn.close()
+        # The connection outlives this block, so drop any uncommitted work
+        # the way closing it used to
+        if conn.in_transaction:
+            conn.rollback()
+
+
+def _execute_tuples(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+    """Execute a query whose rows come back as plain tuples, not sqlite3.Row."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params)
 
 
 # =============================================================================
@@ -157,6 +459,7 @@ def create_task(user_id: str, title: str, description: Optional[str] = None,
                 (user_id, title, description, priority)
             )
             conn.commit()
+            _invalidate_summaries(user_id)
             task_id = cursor.lastrowid
             logger.info(f"Created task {task_id} for user {user_id}: {title}")
             return {
@@ -172,33 +475,58 @@ def create_task(user_id: str, title: str, description: Optional[str] = None,
             }
 
 
-def list_open_tasks(user_id: str) -> list[dict]:
-    """List all open tasks for a user."""
+def create_tasks_bulk(user_id: str, tasks: list[dict]) -> dict:
+    """
+    Create several tasks in one transaction.
+
+    Tasks whose title already exists for the user are skipped.
+
+    Args:
+        user_id: User identifier
+        tasks: Dicts with "title" and optional "description" and "priority"
+
+    Returns:
+        Dict with created and skipped counts
+    """
+    rows = [
+        (user_id, task["title"], task.get("description"), task.get("priority", "normal"))
+        for task in tasks
+    ]
     with get_db_connection() as conn:
-        cursor = conn.execute(
+        # One prepared INSERT and one commit for the whole batch
+        cursor = conn.executemany(
             """
-            SELECT id, title, description, priority, created_at
-            FROM tasks
-            WHERE user_id = ? AND status = 'open'
-            ORDER BY
-                CASE priority
-                    WHEN 'high' THEN 1
-                    WHEN 'normal' THEN 2
-                    WHEN 'low' THEN 3
-                END,
-                created_at DESC
+            INSERT OR IGNORE INTO tasks (user_id, title, description, priority, status)
+            VALUES (?, ?, ?, ?, 'open')
             """,
-            (user_id,)
+            rows
         )
+        conn.commit()
+        created = cursor.rowcount
+    if created:
+        _invalidate_summaries(user_id)
+
+    logger.info(f"Created {created} of {len(rows)} tasks for user {user_id}")
+    return {
+        "success": True,
+        "created": created,
+        "skipped": len(rows) - created
+    }
+
+
+def list_open_tasks(user_id: str) -> list[dict]:
+    """List all open tasks for a user."""
+    with get_db_connection() as conn:
+        cursor = _execute_tuples(conn, SQL_LIST_OPEN_TASKS, (user_id,))
         tasks = [
             {
-                "id": row["id"],
-                "title": row["title"],
-                "description": row["description"],
-                "priority": row["priority"],
-                "created_at": row["created_at"]
+                "id": task_id,
+                "title": title,
+                "description": description,
+                "priority": priority,
+                "created_at": created_at
             }
-            for row in cursor.fetchall()
+            for task_id, title, description, priority, created_at in cursor.fetchall()
         ]
         logger.info(f"Listed {len(tasks)} open tasks for user {user_id}")
         return tasks
@@ -207,24 +535,15 @@ def list_open_tasks(user_id: str) -> list[dict]:
 def list_completed_tasks(user_id: str, limit: int = 5) -> list[dict]:
     """List recently completed tasks for a user."""
     with get_db_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, title, description, completed_at
-            FROM tasks
-            WHERE user_id = ? AND status = 'completed'
-            ORDER BY completed_at DESC
-            LIMIT ?
-            """,
-            (user_id, limit)
-        )
+        cursor = _execute_tuples(conn, SQL_LIST_COMPLETED_TASKS, (user_id, limit))
         tasks = [
             {
-                "id": row["id"],
-                "title": row["title"],
-                "description": row["description"],
-                "completed_at": row["completed_at"]
+                "id": task_id,
+                "title": title,
+                "description": description,
+                "completed_at": completed_at
             }
-            for row in cursor.fetchall()
+            for task_id, title, description, completed_at in cursor.fetchall()
         ]
         return tasks
 
@@ -233,15 +552,15 @@ def get_open_count(user_id: Optional[str] = None) -> dict:
     """Get count of open tasks."""
     with get_db_connection() as conn:
         if user_id:
-            cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM tasks WHERE user_id = ? AND status = 'open'",
+            row = conn.execute(
+                "SELECT open_count FROM task_counts WHERE user_id = ?",
                 (user_id,)
-            )
+            ).fetchone()
+            count = row["open_count"] if row else 0
         else:
-            cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM tasks WHERE status = 'open'"
-            )
-        count = cursor.fetchone()["count"]
+            count = conn.execute(
+                "SELECT COALESCE(SUM(open_count), 0) AS count FROM task_counts"
+            ).fetchone()["count"]
         logger.info(f"Open task count for user {user_id or 'all'}: {count}")
         return {"count": count, "user_id": user_id or "all"}
 
@@ -260,6 +579,7 @@ def complete_task(user_id: str, task_id: int) -> dict:
         conn.commit()
 
         if cursor.rowcount > 0:
+            _invalidate_summaries(user_id)
             logger.info(f"Completed task {task_id} for user {user_id}")
             return {
                 "success": True,
@@ -277,51 +597,221 @@ def complete_task(user_id: str, task_id: int) -> dict:
 # Reminder Functions
 # =============================================================================
 
-def generate_summary(user_id: str, include_completed: bool = False) -> dict:
+class _TTLCache:
+    """Small thread-safe TTL cache."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[Any, tuple[Any, float]] = {}
+        # Invalidation count per key, for readers that race a writer
+        self._generations: dict[Any, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            return value
+
+    def generation(self, key: Any) -> int:
+        """Return how many times the key has been invalidated."""
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def set(self, key: Any, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store a value, evicting the oldest entry when full.
+
+        If generation (from generation()) is given, the value is dropped when
+        the key was invalidated since, so rows read before a write are never
+        cached after it.
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation is not None and self._generations.get(key, 0) != generation:
+                return
+            if key not in self._data and len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (value, time.monotonic() + self.ttl)
+
+    def pop(self, key: Any) -> None:
+        """Drop a cached value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, key: Any) -> None:
+        """Drop a cached value and bump the key's generation."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+
+# Summaries keyed by (user_id, include_completed). An entry is only reused
+# within the minute it was generated for; task writes invalidate the user's
+# entries, and a summary read before such a write is not stored.
+# Writes only invalidate their own process, so the cache is off when several
+# server processes share the database.
+_summary_cache = _TTLCache(maxsize=10000 if SERVER_PROCESSES == 1 else 0, ttl=60)
+
+# Preference lookups keyed by user_id, off with several processes for the same
+# reason. Email setters write the new values through since they know the whole
+# entry; reminder entries carry last_reminder, so their writes drop them.
+_email_prefs_cache = _TTLCache(maxsize=10000 if SERVER_PROCESSES == 1 else 0, ttl=60)
+_reminder_prefs_cache = _TTLCache(maxsize=10000 if SERVER_PROCESSES == 1 else 0, ttl=60)
+
+
+def _invalidate_summaries(user_id: str) -> None:
+    """Forget cached summaries after a user's tasks change."""
+    _summary_cache.invalidate((user_id, True))
+    _summary_cache.invalidate((user_id, False))
+
+
+# Priority markers used in task summaries
+PRIORITY_EMOJI = {"high": "🔴", "normal": "🟡", "low": "🟢"}
+DEFAULT_EMOJI = "🟡"
+
+
+def generate_summary(user_id: str, include_completed: bool = False,
+                     now_str: Optional[str] = None) -> dict:
     """
     Generate a task summary for reminders.
 
     Args:
         user_id: User identifier
         include_completed: Whether to include recently completed tasks
+        now_str: Timestamp shown in the summary (current time if None)
 
     Returns:
         Dict with summary text and metadata
     """
-    open_tasks = list_open_tasks(user_id)
-    completed_tasks = list_completed_tasks(user_id, limit=3) if include_completed else []
+    now_str = now_str or datetime.now().strftime("%Y-%m-%d %H:%M")
+    cache_key = (user_id, include_completed)
+    cached = _summary_cache.get(cache_key)
+    if cached is not None and cached["generated_at"] == now_str:
+        return cached
+    # Taken before reading, so a task write during the query keeps this
+    # summary out of the cache
+    generation = _summary_cache.generation(cache_key)
+
+    completed_limit = 3 if include_completed else 0
+    open_tasks = []
+    completed_tasks = []
+    with get_db_connection() as conn:
+        cursor = conn.execute(SQL_SUMMARY_TASKS, (user_id, user_id, completed_limit))
+        for row in cursor:
+            if row["bucket"] == "open":
+                open_tasks.append(row)
+            else:
+                completed_tasks.append(row)
+
+    summary = generate_summary_from(user_id, open_tasks, completed_tasks, now_str)
+    _summary_cache.set(cache_key, summary, generation)
+    return summary
+
+
+def generate_summaries(user_ids: list[str], include_completed: bool = False) -> dict:
+    """
+    Generate task summaries for many users with one query per batch.
 
-    # Build summary text
-    lines = []
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-    lines.append(f"📋 Task Summary ({now})")
-    lines.append("")
+    Used by the scheduler so a reminder tick costs one round-trip instead
+    of one per user.
+
+    Args:
+        user_ids: User identifiers
+        include_completed: Whether to include recently completed tasks
+
+    Returns:
+        Dict with a summary per user, keyed by user_id
+    """
+    completed_limit = 3 if include_completed else 0
+    unique_ids = list(dict.fromkeys(user_ids))
+    grouped = {user_id: ([], []) for user_id in unique_ids}
+    generations = {
+        user_id: _summary_cache.generation((user_id, include_completed))
+        for user_id in unique_ids
+    }
+
+    with get_db_connection() as conn:
+        for start in range(0, len(unique_ids), SUMMARY_BATCH_SIZE):
+            batch = unique_ids[start:start + SUMMARY_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            query = SQL_SUMMARY_TASKS_BULK.format(users=placeholders)
+            cursor = _execute_tuples(conn, query, (*batch, *batch, completed_limit))
+            for user_id, open_json, completed_json in cursor:
+                grouped[user_id] = (
+                    sorted(json.loads(open_json), key=itemgetter("position")),
+                    sorted(json.loads(completed_json), key=itemgetter("position"))
+                )
+
+    # One timestamp for the whole batch
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+    summaries = {}
+    for user_id, (open_tasks, completed_tasks) in grouped.items():
+        summary = generate_summary_from(user_id, open_tasks, completed_tasks, now_str)
+        # Let single-user retries in the same minute reuse this result
+        _summary_cache.set((user_id, include_completed), summary, generations[user_id])
+        summaries[user_id] = summary
+    return {"success": True, "summaries": summaries, "count": len(summaries)}
+
+
+def _render_summary(now: str, open_tasks: list, completed_tasks: list,
+                    high_priority: int) -> Iterator[str]:
+    """Yield the lines of a task summary."""
+    yield f"📋 Task Summary ({now})"
+    yield ""
 
     # Open tasks section
     if open_tasks:
-        lines.append(f"📌 Open Tasks ({len(open_tasks)}):")
+        yield f"📌 Open Tasks ({len(open_tasks)}):"
         for i, task in enumerate(open_tasks, 1):
-            priority_emoji = {"high": "🔴", "normal": "🟡", "low": "🟢"}.get(task["priority"], "🟡")
-            lines.append(f"  {i}. {priority_emoji} {task['title']}")
-            if task.get("description"):
-                lines.append(f"     └─ {task['description'][:50]}...")
+            emoji = PRIORITY_EMOJI.get(task["priority"], DEFAULT_EMOJI)
+            yield f"  {i}. {emoji} {task['title']}"
+            if task["description"]:
+                yield f"     └─ {task['description'][:50]}..."
     else:
-        lines.append("✅ No open tasks! Great job!")
+        yield "✅ No open tasks! Great job!"
 
     # Completed tasks section
     if completed_tasks:
-        lines.append("")
-        lines.append(f"✓ Recently Completed ({len(completed_tasks)}):")
+        yield ""
+        yield f"✓ Recently Completed ({len(completed_tasks)}):"
         for task in completed_tasks:
-            lines.append(f"  • {task['title']}")
+            yield f"  • {task['title']}"
 
     # Statistics
-    lines.append("")
-    high_priority = sum(1 for t in open_tasks if t.get("priority") == "high")
+    yield ""
     if high_priority > 0:
-        lines.append(f"⚠️ {high_priority} high-priority task(s) need attention!")
+        yield f"⚠️ {high_priority} high-priority task(s) need attention!"
+
+
+def generate_summary_from(user_id: str, open_tasks: list, completed_tasks: list,
+                          now_str: Optional[str] = None) -> dict:
+    """
+    Format a task summary from already fetched rows.
+
+    Args:
+        user_id: User identifier
+        open_tasks: Open task rows in priority order
+        completed_tasks: Recently completed task rows
+        now_str: Timestamp shown in the summary (current time if None)
+
+    Returns:
+        Dict with summary text and metadata
+    """
+    high_priority = sum(1 for task in open_tasks if task["priority"] == "high")
 
-    summary_text = "\n".join(lines)
+    now = now_str or datetime.now().strftime("%Y-%m-%d %H:%M")
+    summary_text = "\n".join(
+        _render_summary(now, open_tasks, completed_tasks, high_priority)
+    )
 
     logger.info(f"Generated summary for user {user_id}: {len(open_tasks)} open tasks")
 
@@ -337,25 +827,36 @@ def generate_summary(user_id: str, include_completed: bool = False) -> dict:
 
 def get_reminder_preferences(user_id: str) -> dict:
     """Get reminder preferences for a user."""
+    cached = _reminder_prefs_cache.get(user_id)
+    if cached is not None:
+        return cached
+
     with get_db_connection() as conn:
-        cursor = conn.execute(
-            "SELECT * FROM reminder_preferences WHERE user_id = ?",
+        row = _execute_tuples(
+            conn,
+            """
+            SELECT enabled, schedule_hour, schedule_minute, last_reminder
+            FROM reminder_preferences WHERE user_id = ?
+            """,
             (user_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return {
-                "enabled": bool(row["enabled"]),
-                "schedule_hour": row["schedule_hour"],
-                "schedule_minute": row["schedule_minute"],
-                "last_reminder": row["last_reminder"]
-            }
-        return {
+        ).fetchone()
+    if row:
+        enabled, schedule_hour, schedule_minute, last_reminder = row
+        prefs = {
+            "enabled": bool(enabled),
+            "schedule_hour": schedule_hour,
+            "schedule_minute": schedule_minute,
+            "last_reminder": last_reminder
+        }
+    else:
+        prefs = {
             "enabled": False,
             "schedule_hour": 9,
             "schedule_minute": 0,
             "last_reminder": None
         }
+    _reminder_prefs_cache.set(user_id, prefs)
+    return prefs
 
 
 def set_reminder_preferences(user_id: str, enabled: bool,
@@ -374,6 +875,7 @@ def set_reminder_preferences(user_id: str, enabled: bool,
             (user_id, int(enabled), hour, minute)
         )
         conn.commit()
+        _reminder_prefs_cache.pop(user_id)
         logger.info(f"Set reminder for user {user_id}: enabled={enabled}, time={hour:02d}:{minute:02d}")
         return {
             "success": True,
@@ -383,6 +885,40 @@ def set_reminder_preferences(user_id: str, enabled: bool,
         }
 
 
+def set_preferences_bulk(rows: list[tuple]) -> dict:
+    """
+    Set reminder and email preferences for many users in one transaction.
+
+    Args:
+        rows: (user_id, enabled, hour, minute, email_enabled, email_recipient) tuples
+
+    Returns:
+        Dict with success status and number of rows written
+    """
+    params = []
+    for user_id, enabled, hour, minute, email_enabled, email_recipient in rows:
+        if email_enabled and email_recipient and not validate_email(email_recipient):
+            return {
+                "success": False,
+                "error": f"Invalid email format for user {user_id}: {email_recipient}"
+            }
+        params.append((user_id, int(enabled), hour, minute,
+                       int(email_enabled), email_recipient))
+
+    with get_db_connection() as conn:
+        conn.executemany(SQL_UPSERT_PREFERENCES, params)
+        conn.commit()
+    for user_id, _, _, _, email_enabled, email_recipient in params:
+        _reminder_prefs_cache.pop(user_id)
+        _email_prefs_cache.set(user_id, {
+            "email_enabled": bool(email_enabled),
+            "email_recipient": email_recipient
+        })
+
+    logger.info(f"Set preferences for {len(params)} user(s)")
+    return {"success": True, "count": len(params)}
+
+
 def update_last_reminder(user_id: str) -> None:
     """Update the last reminder timestamp for a user."""
     with get_db_connection() as conn:
@@ -395,29 +931,60 @@ def update_last_reminder(user_id: str) -> None:
             (user_id,)
         )
         conn.commit()
+    _reminder_prefs_cache.pop(user_id)
 
 
-def get_users_for_reminder(hour: int, minute: int) -> list[str]:
-    """Get list of user IDs that should receive reminders at given time."""
+def update_last_reminders(user_ids: list[str]) -> int:
+    """
+    Update the last reminder timestamp for many users in one transaction.
+
+    Args:
+        user_ids: User identifiers
+
+    Returns:
+        Number of preference rows updated
+    """
     with get_db_connection() as conn:
-        cursor = conn.execute(
+        cursor = conn.executemany(
             """
-            SELECT user_id FROM reminder_preferences
-            WHERE enabled = 1 AND schedule_hour = ? AND schedule_minute = ?
+            UPDATE reminder_preferences
+            SET last_reminder = CURRENT_TIMESTAMP
+            WHERE user_id = ?
             """,
-            (hour, minute)
+            [(user_id,) for user_id in user_ids]
         )
-        return [row["user_id"] for row in cursor.fetchall()]
+        conn.commit()
+    for user_id in user_ids:
+        _reminder_prefs_cache.pop(user_id)
+    return cursor.rowcount
+
+
+def get_users_for_reminder(hour: int, minute: int) -> list[str]:
+    """Get list of user IDs that should receive reminders at given time."""
+    with get_db_connection() as conn:
+        cursor = _execute_tuples(conn, SQL_USERS_FOR_REMINDER, (hour, minute))
+        # Consume the cursor directly; a fetchall() list would be copied again
+        return [user_id for (user_id,) in cursor]
 
 
 # =============================================================================
 # Email Functions
 # =============================================================================
 
+# Matched with fullmatch, so no ^/$ anchors
 EMAIL_REGEX = re.compile(
-    r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
 )
 
+# Longest address SMTP allows (RFC 5321); longer input is rejected before matching
+MAX_EMAIL_LENGTH = 254
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_email(email: str) -> bool:
+    """Check an email string against EMAIL_REGEX (memoized)."""
+    return EMAIL_REGEX.fullmatch(email.strip()) is not None
+
 
 def validate_email(email: str) -> bool:
     """
@@ -429,14 +996,91 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not email or not isinstance(email, str):
+    if not email or not isinstance(email, str) or len(email) > MAX_EMAIL_LENGTH:
         return False
-    return EMAIL_REGEX.match(email.strip()) is not None
+    return _is_valid_email(email)
+
 
+# Persistent SMTP session shared by all sends; smtplib is not thread-safe,
+# so every use happens under _smtp_lock
+_smtp_conn: Optional[smtplib.SMTP] = None
+_smtp_lock = threading.Lock()
 
-def is_smtp_configured() -> bool:
-    """Check if SMTP is properly configured."""
-    return bool(SMTP_HOST and SMTP_USER and SMTP_PASSWORD and SMTP_FROM_EMAIL)
+
+def _open_smtp() -> smtplib.SMTP:
+    """Connect, upgrade to TLS if configured, and log in."""
+    conn = smtplib.SMTP(SMTP_CONFIG.host, SMTP_CONFIG.port)
+    try:
+        if SMTP_CONFIG.use_tls:
+            conn.starttls(context=ssl.create_default_context())
+        conn.login(SMTP_CONFIG.user, SMTP_CONFIG.password)
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def _close_smtp() -> None:
+    """Close the shared SMTP session. Must be called with _smtp_lock held."""
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.quit()
+        except smtplib.SMTPException:
+            _smtp_conn.close()
+        except OSError:
+            pass
+        _smtp_conn = None
+
+
+def _get_smtp() -> smtplib.SMTP:
+    """
+    Get the shared SMTP session, reconnecting if the server dropped it.
+
+    Must be called with _smtp_lock held.
+    """
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            if _smtp_conn.noop()[0] == 250:
+                return _smtp_conn
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_smtp()
+    _smtp_conn = _open_smtp()
+    return _smtp_conn
+
+
+def close_smtp() -> None:
+    """Close the shared SMTP session (on shutdown)."""
+    with _smtp_lock:
+        _close_smtp()
+
+
+def _check_email_request(recipient_email: str) -> Optional[dict]:
+    """Return an error result if SMTP is unconfigured or the address is invalid."""
+    if not SMTP_CONFIG.configured:
+        return {
+            "success": False,
+            "error": "SMTP not configured. Set SMTP_HOST, SMTP_USER, SMTP_PASSWORD, SMTP_FROM_EMAIL environment variables."
+        }
+
+    if not validate_email(recipient_email):
+        return {
+            "success": False,
+            "error": f"Invalid email format: {recipient_email}"
+        }
+    return None
+
+
+def _build_email(recipient_email: str, subject: str, message_text: str) -> EmailMessage:
+    """Build a plain-text email message (single part, no multipart wrapper)."""
+    msg = EmailMessage()
+    msg["From"] = SMTP_CONFIG.from_email
+    msg["To"] = recipient_email.strip()
+    msg["Subject"] = subject
+    msg.set_content(message_text, subtype="plain", charset="utf-8")
+    return msg
 
 
 def send_email_sync(recipient_email: str, subject: str, message_text: str) -> dict:
@@ -451,53 +1095,158 @@ def send_email_sync(recipient_email: str, subject: str, message_text: str) -> di
     Returns:
         Dict with success status and message/error
     """
-    if not is_smtp_configured():
+    error = _check_email_request(recipient_email)
+    if error:
+        return error
+
+    try:
+        msg = _build_email(recipient_email, subject, message_text)
+
+        # Send over the shared session; retry once on a fresh one if the
+        # server closed it between the NOOP check and the send
+        with _smtp_lock:
+            try:
+                _get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                _close_smtp()
+                _get_smtp().send_message(msg)
+
+        logger.info(f"Email sent successfully to {recipient_email}")
         return {
-            "success": False,
-            "error": "SMTP not configured. Set SMTP_HOST, SMTP_USER, SMTP_PASSWORD, SMTP_FROM_EMAIL environment variables."
+            "success": True,
+            "message": f"Email sent to {recipient_email}"
         }
 
-    if not validate_email(recipient_email):
+    except smtplib.SMTPAuthenticationError as e:
+        logger.error(f"SMTP authentication failed: {e}")
         return {
             "success": False,
-            "error": f"Invalid email format: {recipient_email}"
+            "error": "SMTP authentication failed. Check credentials."
         }
+    except smtplib.SMTPException as e:
+        logger.error(f"SMTP error: {e}")
+        return {
+            "success": False,
+            "error": f"SMTP error: {str(e)}"
+        }
+    except Exception as e:
+        logger.error(f"Email send failed: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": f"Failed to send email: {str(e)}"
+        }
+
+
+def send_many(messages: list[tuple[str, str, str]]) -> list[dict]:
+    """
+    Send several emails over the shared SMTP session.
+
+    Args:
+        messages: (recipient_email, subject, message_text) tuples
+
+    Returns:
+        One result dict per message, in order
+    """
+    return [send_email_sync(*message) for message in messages]
+
+
+# Warm aiosmtplib sessions shared by async sends. Clients connect on first
+# borrow and stay logged in; the pool belongs to the loop that created it.
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+
+_smtp_pool: Optional[asyncio.Queue] = None
+_smtp_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_smtp_pool() -> asyncio.Queue:
+    """Return the running loop's SMTP client pool, creating it if needed."""
+    global _smtp_pool, _smtp_pool_loop
+    loop = asyncio.get_running_loop()
+    if _smtp_pool is None or _smtp_pool_loop is not loop:
+        _smtp_pool = asyncio.Queue(maxsize=SMTP_POOL_SIZE)
+        _smtp_pool_loop = loop
+        for _ in range(SMTP_POOL_SIZE):
+            _smtp_pool.put_nowait(aiosmtplib.SMTP(
+                hostname=SMTP_CONFIG.host,
+                port=SMTP_CONFIG.port,
+                username=SMTP_CONFIG.user,
+                password=SMTP_CONFIG.password,
+                start_tls=SMTP_CONFIG.use_tls
+            ))
+    return _smtp_pool
+
+
+@asynccontextmanager
+async def _pooled_smtp():
+    """Borrow a connected SMTP client from the pool."""
+    pool = _get_smtp_pool()
+    client = await pool.get()
+    try:
+        if not client.is_connected:
+            await client.connect()
+        yield client
+    finally:
+        pool.put_nowait(client)
 
+
+async def _send_pooled(client, msg: EmailMessage) -> None:
+    """Send on a pooled client, reconnecting once if the server dropped it."""
     try:
-        # Create message
-        msg = MIMEMultipart()
-        msg["From"] = SMTP_FROM_EMAIL
-        msg["To"] = recipient_email.strip()
-        msg["Subject"] = subject
-
-        # Add body
-        msg.attach(MIMEText(message_text, "plain", "utf-8"))
-
-        # Connect and send
-        if SMTP_USE_TLS:
-            context = ssl.create_default_context()
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                server.starttls(context=context)
-                server.login(SMTP_USER, SMTP_PASSWORD)
-                server.send_message(msg)
-        else:
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                server.login(SMTP_USER, SMTP_PASSWORD)
-                server.send_message(msg)
+        await client.send_message(msg)
+    except aiosmtplib.SMTPServerDisconnected:
+        client.close()
+        await client.connect()
+        await client.send_message(msg)
+
+
+async def close_smtp_pool(app: Optional[web.Application] = None) -> None:
+    """Log out of every pooled SMTP session (aiohttp on_cleanup)."""
+    global _smtp_pool, _smtp_pool_loop
+    if _smtp_pool is None:
+        return
+    while not _smtp_pool.empty():
+        client = _smtp_pool.get_nowait()
+        if client.is_connected:
+            try:
+                await client.quit()
+            except aiosmtplib.SMTPException:
+                client.close()
+    _smtp_pool = None
+    _smtp_pool_loop = None
+
+
+async def _send_email_native(recipient_email: str, subject: str, message_text: str) -> dict:
+    """
+    Send email with aiosmtplib on the event loop (no worker thread).
+
+    Args:
+        recipient_email: Recipient email address
+        subject: Email subject
+        message_text: Email body text
+
+    Returns:
+        Dict with success status and message/error
+    """
+    error = _check_email_request(recipient_email)
+    if error:
+        return error
 
+    try:
+        async with _pooled_smtp() as client:
+            await _send_pooled(client, _build_email(recipient_email, subject, message_text))
         logger.info(f"Email sent successfully to {recipient_email}")
         return {
             "success": True,
             "message": f"Email sent to {recipient_email}"
         }
 
-    except smtplib.SMTPAuthenticationError as e:
+    except aiosmtplib.SMTPAuthenticationError as e:
         logger.error(f"SMTP authentication failed: {e}")
         return {
             "success": False,
             "error": "SMTP authentication failed. Check credentials."
         }
-    except smtplib.SMTPException as e:
+    except aiosmtplib.SMTPException as e:
         logger.error(f"SMTP error: {e}")
         return {
             "success": False,
@@ -511,6 +1260,44 @@ def send_email_sync(recipient_email: str, subject: str, message_text: str) -> di
         }
 
 
+async def send_many_async(messages: list[tuple[str, str, str]]) -> list[dict]:
+    """
+    Send several emails over one SMTP session without blocking the event loop.
+
+    Args:
+        messages: (recipient_email, subject, message_text) tuples
+
+    Returns:
+        One result dict per message, in order
+    """
+    if aiosmtplib is None or not SMTP_CONFIG.configured:
+        return await asyncio.to_thread(send_many, messages)
+
+    results = []
+    try:
+        async with _pooled_smtp() as client:
+            for recipient_email, subject, message_text in messages:
+                error = _check_email_request(recipient_email)
+                if error:
+                    results.append(error)
+                    continue
+                try:
+                    await _send_pooled(client, _build_email(recipient_email, subject, message_text))
+                    results.append({"success": True, "message": f"Email sent to {recipient_email}"})
+                except (aiosmtplib.SMTPException, OSError) as e:
+                    logger.error(f"SMTP error: {e}")
+                    results.append({"success": False, "error": f"SMTP error: {str(e)}"})
+    except (aiosmtplib.SMTPException, OSError) as e:
+        # Couldn't connect: fail the messages that were never attempted
+        logger.error(f"SMTP connect error: {e}")
+        results.extend(
+            _check_email_request(recipient_email)
+            or {"success": False, "error": f"SMTP error: {str(e)}"}
+            for recipient_email, _, _ in messages[len(results):]
+        )
+    return results
+
+
 async def send_email_async(recipient_email: str, subject: str, message_text: str,
                           max_retries: int = 3) -> dict:
     """
@@ -525,18 +1312,20 @@ async def send_email_async(recipient_email: str, subject: str, message_text: str
     Returns:
         Dict with success status and message/error
     """
-    loop = asyncio.get_event_loop()
     last_error = None
 
     for attempt in range(max_retries):
         try:
-            result = await loop.run_in_executor(
-                None,
-                send_email_sync,
-                recipient_email,
-                subject,
-                message_text
-            )
+            if aiosmtplib is not None:
+                result = await _send_email_native(recipient_email, subject, message_text)
+            else:
+                # Fall back to the pooled blocking sender on a worker thread
+                result = await asyncio.to_thread(
+                    send_email_sync,
+                    recipient_email,
+                    subject,
+                    message_text
+                )
             if result["success"]:
                 return result
             last_error = result.get("error", "Unknown error")
@@ -558,6 +1347,167 @@ async def send_email_async(recipient_email: str, subject: str, message_text: str
     }
 
 
+# Background email delivery for callers that don't need to wait for SMTP.
+# The queue and worker exist only while the HTTP app is running.
+EMAIL_QUEUE_SIZE = 1000
+# Most messages sent per SMTP session when the queue has a backlog
+EMAIL_BATCH_SIZE = 20
+# Seconds to wait for queued emails on shutdown before dropping them
+EMAIL_DRAIN_TIMEOUT = 10
+
+_email_queue: Optional[asyncio.Queue] = None
+_email_worker_task: Optional[asyncio.Task] = None
+
+
+async def _email_worker() -> None:
+    """Drain the email queue, sending each backlog over one SMTP session."""
+    while True:
+        batch = [await _email_queue.get()]
+        while len(batch) < EMAIL_BATCH_SIZE and not _email_queue.empty():
+            batch.append(_email_queue.get_nowait())
+        try:
+            results = await send_many_async(batch)
+            failed = [message for message, result in zip(batch, results) if not result["success"]]
+            if failed:
+                # Resend one by one with send_email_async's retries and backoff
+                retried = await asyncio.gather(*(send_email_async(*message) for message in failed))
+                for (recipient_email, _, _), result in zip(failed, retried):
+                    if not result["success"]:
+                        logger.error(f"Queued email to {recipient_email} lost: {result['error']}")
+        except Exception as e:
+            logger.error(f"Queued email batch of {len(batch)} failed: {e}", exc_info=True)
+        finally:
+            for _ in batch:
+                _email_queue.task_done()
+
+
+async def queue_email(recipient_email: str, subject: str, message_text: str) -> dict:
+    """
+    Queue an email for background delivery and return immediately.
+
+    The request is validated up front, so configuration and address errors
+    are still reported to the caller. Sends inline if no worker is running.
+
+    Args:
+        recipient_email: Recipient email address
+        subject: Email subject
+        message_text: Email body text
+
+    Returns:
+        Dict with success status and queued flag, or an error
+    """
+    if _email_queue is None:
+        return await send_email_async(recipient_email, subject, message_text)
+
+    error = _check_email_request(recipient_email)
+    if error:
+        return error
+
+    await _email_queue.put((recipient_email, subject, message_text))
+    return {
+        "success": True,
+        "queued": True,
+        "message": f"Email to {recipient_email} queued"
+    }
+
+
+async def start_email_worker(app: web.Application) -> None:
+    """Create the email queue and start its worker (aiohttp on_startup)."""
+    global _email_queue, _email_worker_task
+    _email_queue = asyncio.Queue(maxsize=EMAIL_QUEUE_SIZE)
+    _email_worker_task = asyncio.create_task(_email_worker())
+
+
+async def stop_email_worker(app: web.Application) -> None:
+    """Flush queued emails, then stop the worker (aiohttp on_cleanup)."""
+    global _email_queue, _email_worker_task
+    if _email_worker_task is None:
+        return
+    try:
+        await asyncio.wait_for(_email_queue.join(), timeout=EMAIL_DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Dropping {_email_queue.qsize()} queued email(s) on shutdown")
+    _email_worker_task.cancel()
+    try:
+        await _email_worker_task
+    except asyncio.CancelledError:
+        pass
+    _email_queue = None
+    _email_worker_task = None
+
+
+# Subject of the daily reminder email sent by reminder_run_batch
+REMINDER_EMAIL_SUBJECT = "New Reminder"
+
+
+def _load_reminder_batch(hour: int, minute: int,
+                         include_completed: bool) -> tuple[list[sqlite3.Row], dict]:
+    """Read the recipients scheduled at hour:minute and build their summaries."""
+    with get_db_connection() as conn:
+        recipients = conn.execute(SQL_REMINDER_RECIPIENTS, (hour, minute)).fetchall()
+    if not recipients:
+        return recipients, {}
+    user_ids = [row["user_id"] for row in recipients]
+    return recipients, generate_summaries(user_ids, include_completed)["summaries"]
+
+
+async def run_reminder_batch(hour: int, minute: int, include_completed: bool = False,
+                             send_email: bool = True) -> dict:
+    """
+    Prepare one scheduler tick server-side.
+
+    Builds the summary for every user scheduled at hour:minute and queues
+    reminder emails for users who enabled them. Telegram delivery stays with
+    the caller, which reports delivered users via reminder_mark_sent_bulk.
+
+    Args:
+        hour: Schedule hour (0-23)
+        minute: Schedule minute (0-59)
+        include_completed: Whether summaries include recently completed tasks
+        send_email: Whether to send reminder emails
+
+    Returns:
+        Dict with summary text per user_id and, as "emails", the number of
+        emails accepted for delivery: queued when the background worker is
+        running (sent later, with retries), otherwise sent inline
+    """
+    # Database reads run in a worker thread so the event loop stays free
+    recipients, summaries = await asyncio.to_thread(
+        _load_reminder_batch, hour, minute, include_completed
+    )
+    if not recipients:
+        return {"success": True, "summaries": {}, "emails": 0, "count": 0}
+
+    user_ids = [row["user_id"] for row in recipients]
+
+    emails = 0
+    if send_email:
+        messages = [
+            (row["email_recipient"], REMINDER_EMAIL_SUBJECT, summaries[row["user_id"]]["summary"])
+            for row in recipients
+            if row["email_enabled"] and row["email_recipient"]
+        ]
+        # An email failure must never cost users their Telegram reminders
+        try:
+            if _email_queue is not None:
+                results = [await queue_email(*message) for message in messages]
+            else:
+                results = await asyncio.gather(
+                    *(send_email_async(*message) for message in messages)
+                )
+            emails = sum(1 for result in results if result["success"])
+        except Exception as e:
+            logger.error(f"Reminder emails for {hour:02d}:{minute:02d} failed: {e}", exc_info=True)
+
+    logger.info(f"Prepared reminders for {len(user_ids)} user(s) at {hour:02d}:{minute:02d}, {emails} email(s) accepted")
+    return {
+        "success": True,
+        "summaries": {user_id: summary["summary"] for user_id, summary in summaries.items()},
+        "emails": emails,
+        "count": len(user_ids)
+    }
+
+
 def set_email_preferences(user_id: str, email_enabled: bool,
                           email_recipient: Optional[str] = None) -> dict:
     """
@@ -592,6 +1542,10 @@ def set_email_preferences(user_id: str, email_enabled: bool,
             (user_id, int(email_enabled), email_recipient)
         )
         conn.commit()
+    _email_prefs_cache.set(user_id, {
+        "email_enabled": email_enabled,
+        "email_recipient": email_recipient
+    })
 
     logger.info(f"Set email preferences for user {user_id}: enabled={email_enabled}, recipient={email_recipient}")
     return {
@@ -611,317 +1565,668 @@ def get_email_preferences(user_id: str) -> dict:
     Returns:
         Dict with email preferences
     """
+    cached = _email_prefs_cache.get(user_id)
+    if cached is not None:
+        return cached
+
     with get_db_connection() as conn:
         cursor = conn.execute(
             "SELECT email_enabled, email_recipient FROM reminder_preferences WHERE user_id = ?",
             (user_id,)
         )
         row = cursor.fetchone()
-        if row:
-            return {
-                "email_enabled": bool(row["email_enabled"]),
-                "email_recipient": row["email_recipient"]
-            }
-        return {
+    if row:
+        prefs = {
+            "email_enabled": bool(row["email_enabled"]),
+            "email_recipient": row["email_recipient"]
+        }
+    else:
+        prefs = {
             "email_enabled": False,
             "email_recipient": None
         }
+    _email_prefs_cache.set(user_id, prefs)
+    return prefs
+
+
+def get_email_preferences_bulk(user_ids: list[str]) -> dict:
+    """
+    Get email notification preferences for several users.
+
+    Args:
+        user_ids: User identifiers
+
+    Returns:
+        Dict with preferences per user_id; users without a row get the defaults
+    """
+    unique_ids = list(dict.fromkeys(user_ids))
+    preferences = {
+        user_id: {"email_enabled": False, "email_recipient": None}
+        for user_id in unique_ids
+    }
+
+    with get_db_connection() as conn:
+        for start in range(0, len(unique_ids), EMAIL_PREFS_BATCH_SIZE):
+            batch = unique_ids[start:start + EMAIL_PREFS_BATCH_SIZE]
+            query = SQL_EMAIL_PREFS_BULK.format(users=",".join("?" * len(batch)))
+            for user_id, email_enabled, email_recipient in _execute_tuples(conn, query, tuple(batch)):
+                preferences[user_id] = {
+                    "email_enabled": bool(email_enabled),
+                    "email_recipient": email_recipient
+                }
+
+    return {"preferences": preferences}
 
 
 # =============================================================================
 # MCP Server Setup
 # =============================================================================
 
+# Property schemas shared by several tools below
+_USER_ID_PROP = {"type": "string", "description": "User identifier"}
+_USER_IDS_PROP = {"type": "array", "items": {"type": "string"}, "description": "User identifiers"}
+_TASK_TITLE_PROP = {"type": "string", "description": "Task title"}
+_TASK_DESCRIPTION_PROP = {"type": "string", "description": "Optional task description"}
+_TASK_PRIORITY_PROP = {"type": "string", "enum": ["high", "normal", "low"],
+                       "description": "Task priority (default: normal)"}
+_INCLUDE_COMPLETED_PROP = {"type": "boolean",
+                           "description": "Include recently completed tasks (default: false)"}
+_REMINDER_ENABLED_PROP = {"type": "boolean", "description": "Enable or disable reminders"}
+_REMINDER_HOUR_PROP = {"type": "integer", "description": "Hour for daily reminder (0-23)"}
+_REMINDER_MINUTE_PROP = {"type": "integer", "description": "Minute for daily reminder (0-59)"}
+_HOUR_PROP = {"type": "integer", "description": "Hour (0-23)"}
+_MINUTE_PROP = {"type": "integer", "description": "Minute (0-59)"}
+_EMAIL_RECIPIENT_PROP = {"type": "string", "description": "Email address for notifications"}
+_EMAIL_MESSAGE_PROPS = {
+    "recipient_email": {"type": "string", "description": "Recipient email address"},
+    "subject": {"type": "string", "description": "Email subject"},
+    "message_text": {"type": "string", "description": "Email body text"}
+}
+
+# Tool definitions are static, so build them once at import time
+_TOOLS: list[Tool] = [
+    # Task Tracker Tools
+    Tool(
+        name="task_create",
+        description="Create a new task for tracking",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP,
+                "title": _TASK_TITLE_PROP,
+                "description": _TASK_DESCRIPTION_PROP,
+                "priority": _TASK_PRIORITY_PROP
+            },
+            "required": ["user_id", "title"]
+        }
+    ),
+    Tool(
+        name="task_create_bulk",
+        description="Create several tasks at once; titles that already exist are skipped",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP,
+                "tasks": {
+                    "type": "array",
+                    "description": "Tasks to create",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": _TASK_TITLE_PROP,
+                            "description": _TASK_DESCRIPTION_PROP,
+                            "priority": _TASK_PRIORITY_PROP
+                        },
+                        "required": ["title"]
+                    }
+                }
+            },
+            "required": ["user_id", "tasks"]
+        }
+    ),
+    Tool(
+        name="task_list_open",
+        description="List all open (not completed) tasks for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP
+            },
+            "required": ["user_id"]
+        }
+    ),
+    Tool(
+        name="task_get_open_count",
+        description="Get the count of open tasks",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "string", "description": "Optional user identifier"}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="task_complete",
+        description="Mark a task as completed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP,
+                "task_id": {"type": "integer", "description": "Task ID to complete"}
+            },
+            "required": ["user_id", "task_id"]
+        }
+    ),
+    # Reminder Tools
+    Tool(
+        name="reminder_generate_summary",
+        description="Generate a task summary for reminders. Returns formatted text with open tasks, priorities, and optionally completed tasks.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP,
+                "include_completed": _INCLUDE_COMPLETED_PROP
+            },
+            "required": ["user_id"]
+        }
+    ),
+    Tool(
+        name="reminder_generate_summaries",
+        description="Generate task summaries for several users in one call. Returns a summary per user_id.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_ids": _USER_IDS_PROP,
+                "include_completed": _INCLUDE_COMPLETED_PROP
+            },
+            "required": ["user_ids"]
+        }
+    ),
+    Tool(
+        name="reminder_get_preferences",
+        description="Get reminder preferences for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP
+            },
+            "required": ["user_id"]
+        }
+    ),
+    Tool(
+        name="reminder_set_preferences",
+        description="Set reminder preferences for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP,
+                "enabled": _REMINDER_ENABLED_PROP,
+                "hour": _REMINDER_HOUR_PROP,
+                "minute": _REMINDER_MINUTE_PROP
+            },
+            "required": ["user_id", "enabled"]
+        }
+    ),
+    Tool(
+        name="reminder_set_preferences_bulk",
+        description="Set reminder and email preferences for several users in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "preferences": {
+                    "type": "array",
+                    "description": "Preference rows to write",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "user_id": _USER_ID_PROP,
+                            "enabled": _REMINDER_ENABLED_PROP,
+                            "hour": _REMINDER_HOUR_PROP,
+                            "minute": _REMINDER_MINUTE_PROP,
+                            "email_enabled": {"type": "boolean", "description": "Enable email notifications"},
+                            "email_recipient": _EMAIL_RECIPIENT_PROP
+                        },
+                        "required": ["user_id", "enabled"]
+                    }
+                }
+            },
+            "required": ["preferences"]
+        }
+    ),
+    Tool(
+        name="reminder_get_scheduled_users",
+        description="Get list of users scheduled for reminder at given time",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hour": _HOUR_PROP,
+                "minute": _MINUTE_PROP
+            },
+            "required": ["hour", "minute"]
+        }
+    ),
+    Tool(
+        name="reminder_mark_sent",
+        description="Mark that a reminder was sent to a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP
+            },
+            "required": ["user_id"]
+        }
+    ),
+    Tool(
+        name="reminder_mark_sent_bulk",
+        description="Mark the daily reminder as sent for several users",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_ids": _USER_IDS_PROP
+            },
+            "required": ["user_ids"]
+        }
+    ),
+    Tool(
+        name="reminder_run_batch",
+        description="Build summaries for every user scheduled at the given time and queue their reminder emails. Returns summary text per user_id.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hour": _HOUR_PROP,
+                "minute": _MINUTE_PROP,
+                "include_completed": _INCLUDE_COMPLETED_PROP,
+                "send_email": {"type": "boolean",
+                               "description": "Send reminder emails to opted-in users (default: true)"}
+            },
+            "required": ["hour", "minute"]
+        }
+    ),
+    # Email Notification Tools
+    Tool(
+        name="notification_send_email",
+        description="Send an email notification. Requires SMTP configuration via environment variables.",
+        inputSchema={
+            "type": "object",
+            "properties": _EMAIL_MESSAGE_PROPS,
+            "required": ["recipient_email", "subject", "message_text"]
+        }
+    ),
+    Tool(
+        name="notification_queue_email",
+        description="Queue an email notification for background delivery and return without waiting for SMTP. Requires SMTP configuration via environment variables.",
+        inputSchema={
+            "type": "object",
+            "properties": _EMAIL_MESSAGE_PROPS,
+            "required": ["recipient_email", "subject", "message_text"]
+        }
+    ),
+    Tool(
+        name="notification_set_email_preferences",
+        description="Set email notification preferences for reminder notifications",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP,
+                "email_enabled": {"type": "boolean", "description": "Enable/disable email notifications"},
+                "email_recipient": _EMAIL_RECIPIENT_PROP
+            },
+            "required": ["user_id", "email_enabled"]
+        }
+    ),
+    Tool(
+        name="notification_get_email_preferences",
+        description="Get email notification preferences for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": _USER_ID_PROP
+            },
+            "required": ["user_id"]
+        }
+    ),
+    Tool(
+        name="notification_get_email_preferences_bulk",
+        description="Get email notification preferences for several users, keyed by user_id",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_ids": _USER_IDS_PROP
+            },
+            "required": ["user_ids"]
+        }
+    ),
+    Tool(
+        name="notification_validate_email",
+        description="Validate an email address format",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email": {"type": "string", "description": "Email address to validate"}
+            },
+            "required": ["email"]
+        }
+    ),
+]
+
+# GET /tools response body, serialized once since the tool list never changes
+_TOOLS_JSON = json.dumps({
+    "tools": [
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "inputSchema": tool.inputSchema
+        }
+        for tool in _TOOLS
+    ]
+}).encode()
+
+# The body only changes with a new release, so clients may reuse it for a
+# minute and revalidate with If-None-Match afterwards
+_TOOLS_HEADERS = {
+    "Cache-Control": "public, max-age=60",
+    "ETag": '"' + hashlib.sha256(_TOOLS_JSON).hexdigest()[:16] + '"',
+}
+
+
+def _schema_type(schema: dict, name: str) -> Any:
+    """
+    Map a (simple) JSON Schema to the equivalent msgspec type.
+
+    Only the keywords used by the tool schemas above are supported:
+    type, enum, items, properties and required.
+    """
+    if "enum" in schema:
+        return Literal[tuple(schema["enum"])]
+
+    kind = schema.get("type")
+    if kind == "string":
+        return str
+    if kind == "integer":
+        return int
+    if kind == "boolean":
+        return bool
+    if kind == "array":
+        return list[_schema_type(schema.get("items", {}), name)]
+    if kind == "object":
+        required = set(schema.get("required", []))
+        fields = []
+        for field, field_schema in schema.get("properties", {}).items():
+            field_type = _schema_type(field_schema, f"{name}_{field}")
+            if field in required:
+                fields.append((field, field_type))
+            else:
+                # UNSET rather than None so an explicit null is still rejected
+                fields.append((field, Union[field_type, msgspec.UnsetType], msgspec.UNSET))
+        return msgspec.defstruct(name, fields, forbid_unknown_fields=False)
+    return Any
+
+
+def _struct_validator(schema: dict, name: str) -> Callable[[dict[str, Any]], Any]:
+    """Build a validator that converts arguments into a msgspec Struct."""
+    struct_type = _schema_type(schema, name)
+    return functools.partial(msgspec.convert, type=struct_type)
+
+
+# Argument validators derived from each tool's inputSchema (optional dependencies).
+# msgspec converts into Struct types in C; fastjsonschema is the fallback.
+if msgspec is not None:
+    _VALIDATORS = {tool.name: _struct_validator(tool.inputSchema, tool.name) for tool in _TOOLS}
+    _VALIDATION_ERRORS: tuple[type[Exception], ...] = (msgspec.ValidationError,)
+elif fastjsonschema is not None:
+    _VALIDATORS = {tool.name: fastjsonschema.compile(tool.inputSchema) for tool in _TOOLS}
+    _VALIDATION_ERRORS = (fastjsonschema.JsonSchemaException,)
+else:
+    _VALIDATORS = {}
+    _VALIDATION_ERRORS = ()
+
 server = Server("mcp-planner")
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available MCP tools."""
-    return [
-        # Task Tracker Tools
-        Tool(
-            name="task_create",
-            description="Create a new task for tracking",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"},
-                    "title": {"type": "string", "description": "Task title"},
-                    "description": {"type": "string", "description": "Optional task description"},
-                    "priority": {"type": "string", "enum": ["high", "normal", "low"],
-                                "description": "Task priority (default: normal)"}
-                },
-                "required": ["user_id", "title"]
-            }
-        ),
-        Tool(
-            name="task_list_open",
-            description="List all open (not completed) tasks for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"}
-                },
-                "required": ["user_id"]
-            }
-        ),
-        Tool(
-            name="task_get_open_count",
-            description="Get the count of open tasks",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "Optional user identifier"}
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="task_complete",
-            description="Mark a task as completed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"},
-                    "task_id": {"type": "integer", "description": "Task ID to complete"}
-                },
-                "required": ["user_id", "task_id"]
-            }
-        ),
-        # Reminder Tools
-        Tool(
-            name="reminder_generate_summary",
-            description="Generate a task summary for reminders. Returns formatted text with open tasks, priorities, and optionally completed tasks.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"},
-                    "include_completed": {"type": "boolean",
-                                         "description": "Include recently completed tasks (default: false)"}
-                },
-                "required": ["user_id"]
-            }
-        ),
-        Tool(
-            name="reminder_get_preferences",
-            description="Get reminder preferences for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"}
-                },
-                "required": ["user_id"]
-            }
-        ),
-        Tool(
-            name="reminder_set_preferences",
-            description="Set reminder preferences for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"},
-                    "enabled": {"type": "boolean", "description": "Enable or disable reminders"},
-                    "hour": {"type": "integer", "description": "Hour for daily reminder (0-23)"},
-                    "minute": {"type": "integer", "description": "Minute for daily reminder (0-59)"}
-                },
-                "required": ["user_id", "enabled"]
-            }
-        ),
-        Tool(
-            name="reminder_get_scheduled_users",
-            description="Get list of users scheduled for reminder at given time",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hour": {"type": "integer", "description": "Hour (0-23)"},
-                    "minute": {"type": "integer", "description": "Minute (0-59)"}
-                },
-                "required": ["hour", "minute"]
-            }
-        ),
-        Tool(
-            name="reminder_mark_sent",
-            description="Mark that a reminder was sent to a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"}
-                },
-                "required": ["user_id"]
-            }
-        ),
-        # Email Notification Tools
-        Tool(
-            name="notification_send_email",
-            description="Send an email notification. Requires SMTP configuration via environment variables.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "recipient_email": {"type": "string", "description": "Recipient email address"},
-                    "subject": {"type": "string", "description": "Email subject"},
-                    "message_text": {"type": "string", "description": "Email body text"}
-                },
-                "required": ["recipient_email", "subject", "message_text"]
-            }
-        ),
-        Tool(
-            name="notification_set_email_preferences",
-            description="Set email notification preferences for reminder notifications",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"},
-                    "email_enabled": {"type": "boolean", "description": "Enable/disable email notifications"},
-                    "email_recipient": {"type": "string", "description": "Email address for notifications"}
-                },
-                "required": ["user_id", "email_enabled"]
-            }
-        ),
-        Tool(
-            name="notification_get_email_preferences",
-            description="Get email notification preferences for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "User identifier"}
-                },
-                "required": ["user_id"]
-            }
-        ),
-        Tool(
-            name="notification_validate_email",
-            description="Validate an email address format",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email": {"type": "string", "description": "Email address to validate"}
-                },
-                "required": ["email"]
-            }
-        ),
-    ]
+    return _TOOLS
+
+
+# Shared result for tools that only report success. call_tool recognizes it by
+# identity and returns the prebuilt content list; never mutate either object.
+_SUCCESS: dict = {"success": True}
+
+
+def _with_count(key: str, items: list) -> dict:
+    """Wrap a list result together with its length."""
+    return {key: items, "count": len(items)}
+
+
+def _mark_reminder_sent(user_id: str) -> dict:
+    """Record that the daily reminder was sent to a user."""
+    update_last_reminder(user_id=user_id)
+    return _SUCCESS
+
+
+def _mark_reminders_sent(user_ids: list[str]) -> dict:
+    """Record that the daily reminder was sent to several users."""
+    return {"success": True, "updated": update_last_reminders(user_ids=user_ids)}
+
+
+def _validate_email_result(email: str) -> dict:
+    """Validate an email address and echo it back with a message."""
+    is_valid = validate_email(email)
+    return {
+        "valid": is_valid,
+        "email": email,
+        "message": "Valid email format" if is_valid else "Invalid email format"
+    }
+
+
+# Tool name -> adapter taking the raw arguments dict, run in a worker thread
+# except for the coroutine adapters listed in _ASYNC_TOOLS. The adapters only map
+# arguments and defaults onto keyword calls, so the task/reminder functions
+# keep plain signatures for direct callers such as run_reminder_batch.
+_HANDLERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    # Task Tracker tools
+    "task_create": lambda a: create_task(
+        user_id=a["user_id"],
+        title=a["title"],
+        description=a.get("description"),
+        priority=a.get("priority", "normal")
+    ),
+    "task_create_bulk": lambda a: create_tasks_bulk(
+        user_id=a["user_id"],
+        tasks=a["tasks"]
+    ),
+    "task_list_open": lambda a: _with_count("tasks", list_open_tasks(user_id=a["user_id"])),
+    "task_get_open_count": lambda a: get_open_count(user_id=a.get("user_id")),
+    "task_complete": lambda a: complete_task(
+        user_id=a["user_id"],
+        task_id=a["task_id"]
+    ),
+    # Reminder tools
+    "reminder_generate_summary": lambda a: generate_summary(
+        user_id=a["user_id"],
+        include_completed=a.get("include_completed", False)
+    ),
+    "reminder_generate_summaries": lambda a: generate_summaries(
+        user_ids=a["user_ids"],
+        include_completed=a.get("include_completed", False)
+    ),
+    "reminder_get_preferences": lambda a: get_reminder_preferences(user_id=a["user_id"]),
+    "reminder_set_preferences": lambda a: set_reminder_preferences(
+        user_id=a["user_id"],
+        enabled=a["enabled"],
+        hour=a.get("hour", 9),
+        minute=a.get("minute", 0)
+    ),
+    "reminder_set_preferences_bulk": lambda a: set_preferences_bulk([
+        (
+            row["user_id"],
+            row["enabled"],
+            row.get("hour", 9),
+            row.get("minute", 0),
+            row.get("email_enabled", False),
+            row.get("email_recipient")
+        )
+        for row in a["preferences"]
+    ]),
+    "reminder_get_scheduled_users": lambda a: _with_count("users", get_users_for_reminder(
+        hour=a["hour"],
+        minute=a["minute"]
+    )),
+    "reminder_mark_sent": lambda a: _mark_reminder_sent(user_id=a["user_id"]),
+    "reminder_mark_sent_bulk": lambda a: _mark_reminders_sent(user_ids=a["user_ids"]),
+    "reminder_run_batch": lambda a: run_reminder_batch(
+        hour=a["hour"],
+        minute=a["minute"],
+        include_completed=a.get("include_completed", False),
+        send_email=a.get("send_email", True)
+    ),
+    # Email notification tools
+    "notification_send_email": lambda a: send_email_async(
+        recipient_email=a["recipient_email"],
+        subject=a["subject"],
+        message_text=a["message_text"]
+    ),
+    "notification_queue_email": lambda a: queue_email(
+        recipient_email=a["recipient_email"],
+        subject=a["subject"],
+        message_text=a["message_text"]
+    ),
+    "notification_set_email_preferences": lambda a: set_email_preferences(
+        user_id=a["user_id"],
+        email_enabled=a["email_enabled"],
+        email_recipient=a.get("email_recipient")
+    ),
+    "notification_get_email_preferences": lambda a: get_email_preferences(user_id=a["user_id"]),
+    "notification_get_email_preferences_bulk": lambda a: get_email_preferences_bulk(
+        user_ids=a["user_ids"]
+    ),
+    "notification_validate_email": lambda a: _validate_email_result(a["email"]),
+}
+
+_ASYNC_TOOLS = frozenset({
+    "notification_send_email",
+    "notification_queue_email",
+    "reminder_run_batch",
+})
+
+
+def _dumps(result: Any) -> str:
+    """Serialize a tool result to JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(result).decode()
+    return json.dumps(result, ensure_ascii=False)
+
+
+# Request body parser for /tools/call; orjson's decode error subclasses
+# json.JSONDecodeError, so the handler catches both the same way
+_loads: Callable[[str], Any] = orjson.loads if orjson is not None else json.loads
+
+
+_SUCCESS_CONTENT = [TextContent(type="text", text=_dumps(_SUCCESS))]
+
+
+def _loggable_args(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Replace email bodies with their length so logs stay small."""
+    body = arguments.get("message_text")
+    if body is None:
+        return arguments
+    return {**arguments, "message_text": f"<{len(body)} chars>"}
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool invocations."""
-    logger.info(f"Tool called: {name} with args: {arguments}")
+    # Lazy %-formatting: arguments are only rendered when INFO is enabled
+    logger.info("Tool called: %s with args: %s", name, _loggable_args(arguments))
+
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        try:
+            validator(arguments)
+        except _VALIDATION_ERRORS as e:
+            message = getattr(e, "message", str(e))
+            logger.warning(f"Invalid arguments for tool {name}: {message}")
+            return [TextContent(type="text", text=_dumps(
+                {"error": f"Invalid arguments: {message}"}
+            ))]
 
     try:
-        # Task Tracker tools
-        if name == "task_create":
-            result = create_task(
-                user_id=arguments["user_id"],
-                title=arguments["title"],
-                description=arguments.get("description"),
-                priority=arguments.get("priority", "normal")
-            )
-        elif name == "task_list_open":
-            tasks = list_open_tasks(user_id=arguments["user_id"])
-            result = {"tasks": tasks, "count": len(tasks)}
-        elif name == "task_get_open_count":
-            result = get_open_count(user_id=arguments.get("user_id"))
-        elif name == "task_complete":
-            result = complete_task(
-                user_id=arguments["user_id"],
-                task_id=arguments["task_id"]
-            )
-        # Reminder tools
-        elif name == "reminder_generate_summary":
-            result = generate_summary(
-                user_id=arguments["user_id"],
-                include_completed=arguments.get("include_completed", False)
-            )
-        elif name == "reminder_get_preferences":
-            result = get_reminder_preferences(user_id=arguments["user_id"])
-        elif name == "reminder_set_preferences":
-            result = set_reminder_preferences(
-                user_id=arguments["user_id"],
-                enabled=arguments["enabled"],
-                hour=arguments.get("hour", 9),
-                minute=arguments.get("minute", 0)
-            )
-        elif name == "reminder_get_scheduled_users":
-            users = get_users_for_reminder(
-                hour=arguments["hour"],
-                minute=arguments["minute"]
-            )
-            result = {"users": users, "count": len(users)}
-        elif name == "reminder_mark_sent":
-            update_last_reminder(user_id=arguments["user_id"])
-            result = {"success": True}
-        # Email notification tools
-        elif name == "notification_send_email":
-            result = await send_email_async(
-                recipient_email=arguments["recipient_email"],
-                subject=arguments["subject"],
-                message_text=arguments["message_text"]
-            )
-        elif name == "notification_set_email_preferences":
-            result = set_email_preferences(
-                user_id=arguments["user_id"],
-                email_enabled=arguments["email_enabled"],
-                email_recipient=arguments.get("email_recipient")
-            )
-        elif name == "notification_get_email_preferences":
-            result = get_email_preferences(user_id=arguments["user_id"])
-        elif name == "notification_validate_email":
-            email = arguments["email"]
-            is_valid = validate_email(email)
-            result = {
-                "valid": is_valid,
-                "email": email,
-                "message": "Valid email format" if is_valid else "Invalid email format"
-            }
-        else:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             result = {"error": f"Unknown tool: {name}"}
+        elif name in _ASYNC_TOOLS:
+            result = await handler(arguments)
+        else:
+            result = await asyncio.to_thread(handler, arguments)
 
-        return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False))]
+        if result is _SUCCESS:
+            return _SUCCESS_CONTENT
+        return [TextContent(type="text", text=_dumps(result))]
 
     except Exception as e:
         logger.error(f"Error calling tool {name}: {e}", exc_info=True)
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=_dumps({"error": str(e)}))]
 
 
 # =============================================================================
 # HTTP Server (REST API for Kubernetes)
 # =============================================================================
 
+# Probe bodies never change, so encode them once
+_HEALTHY_BODY = json.dumps({"status": "healthy", "service": "mcp-planner"}).encode()
+_READY_BODY = json.dumps({"status": "ready"}).encode()
+
+
 async def handle_health(request: web.Request) -> web.Response:
     """Health check endpoint for Kubernetes probes."""
-    return web.json_response({"status": "healthy", "service": "mcp-planner"})
+    return web.Response(body=_HEALTHY_BODY, content_type="application/json")
+
+
+# Readiness probes arrive every few seconds per replica, so the database
+# check result is reused for READY_CACHE_TTL seconds
+READY_CACHE_TTL = float(os.getenv("READY_CACHE_TTL", "5"))
+_ready_checked_at = float("-inf")
+_ready_error: Optional[str] = None
+
+
+def _check_database() -> None:
+    """Run a trivial query, raising if the database is unusable."""
+    with get_db_connection() as conn:
+        conn.execute("SELECT 1")
 
 
 async def handle_ready(request: web.Request) -> web.Response:
     """Readiness check endpoint."""
-    try:
-        # Check database connection
-        with get_db_connection() as conn:
-            conn.execute("SELECT 1")
-        return web.json_response({"status": "ready"})
-    except Exception as e:
-        return web.json_response({"status": "not ready", "error": str(e)}, status=503)
+    global _ready_checked_at, _ready_error
+
+    now = time.monotonic()
+    if now - _ready_checked_at >= READY_CACHE_TTL:
+        try:
+            # Check database connection
+            await asyncio.to_thread(_check_database)
+            _ready_error = None
+        except Exception as e:
+            _ready_error = str(e)
+        _ready_checked_at = now
+
+    if _ready_error is None:
+        return web.Response(body=_READY_BODY, content_type="application/json")
+    return web.json_response({"status": "not ready", "error": _ready_error}, status=503)
 
 
 async def handle_list_tools(request: web.Request) -> web.Response:
     """List available MCP tools via HTTP."""
-    tools = await list_tools()
-    tools_data = [
-        {
-            "name": tool.name,
-            "description": tool.description,
-            "inputSchema": tool.inputSchema
-        }
-        for tool in tools
-    ]
-    return web.json_response({"tools": tools_data})
+    if request.headers.get("If-None-Match") == _TOOLS_HEADERS["ETag"]:
+        return web.Response(status=304, headers=_TOOLS_HEADERS)
+    return web.Response(body=_TOOLS_JSON, content_type="application/json", headers=_TOOLS_HEADERS)
 
 
 async def handle_call_tool(request: web.Request) -> web.Response:
     """Call an MCP tool via HTTP."""
     try:
-        data = await request.json()
+        data = await request.json(loads=_loads)
         tool_name = data.get("name")
         arguments = data.get("arguments", {})
 
@@ -930,10 +2235,13 @@ async def handle_call_tool(request: web.Request) -> web.Response:
 
         result = await call_tool(tool_name, arguments)
 
-        # Parse the result from TextContent
-        if result and len(result) > 0:
-            result_data = json.loads(result[0].text)
-            return web.json_response({"result": result_data})
+        # The TextContent text is already JSON (call_tool always builds it with
+        # _dumps), so wrap it as is instead of decoding and re-encoding it
+        if result:
+            return web.Response(
+                text='{"result": ' + result[0].text + '}',
+                content_type="application/json"
+            )
 
         return web.json_response({"error": "Empty result"}, status=500)
 
@@ -954,20 +2262,38 @@ def create_app() -> web.Application:
     app.router.add_get("/tools", handle_list_tools)
     app.router.add_post("/tools/call", handle_call_tool)
 
+    # Background email delivery for notification_queue_email
+    app.on_startup.append(start_email_worker)
+    app.on_cleanup.append(stop_email_worker)
+    app.on_cleanup.append(close_smtp_pool)
+
     return app
 
 
-async def main():
-    """Run the MCP server with HTTP transport."""
+async def main(init_db: bool = True):
+    """
+    Run the MCP server with HTTP transport.
+
+    Args:
+        init_db: Initialize the database first (already done before forking
+            when several server processes run)
+    """
+    # Bound the pool that blocking tool handlers run in
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=MCP_WORKERS, thread_name_prefix="mcp-io")
+    )
+
     # Initialize database
-    init_database()
+    if init_db:
+        init_database()
 
     # Create and run HTTP server
     app = create_app()
     runner = web.AppRunner(app)
     await runner.setup()
 
-    site = web.TCPSite(runner, HOST, PORT)
+    # Several processes can bind the same port; the kernel balances accepts
+    site = web.TCPSite(runner, HOST, PORT, reuse_port=SERVER_PROCESSES > 1)
 
     logger.info(f"Starting MCP Planner Server on {HOST}:{PORT}")
     logger.info(f"Data directory: {DATA_DIR}")
@@ -979,15 +2305,73 @@ async def main():
 
     await site.start()
 
-    # Keep running
+    # Run until SIGTERM (Kubernetes pod shutdown) or SIGINT, then clean up so
+    # the email queue drains; no periodic wake-ups while idle
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows event loops have no signal handlers; Ctrl+C still cancels
+            pass
+
     try:
-        while True:
-            await asyncio.sleep(3600)
+        await stop_event.wait()
     except asyncio.CancelledError:
         pass
     finally:
+        logger.info("Shutting down MCP Planner Server")
         await runner.cleanup()
+        close_smtp()
+
+
+def _run_server(init_db: bool = True) -> None:
+    """Run main() until shutdown in the current process."""
+    # libuv-based event loop when available (Linux/macOS), stdlib asyncio otherwise
+    if uvloop is not None:
+        uvloop.run(main(init_db))
+    else:
+        asyncio.run(main(init_db))
+
+
+def _run_processes(count: int) -> None:
+    """
+    Run count server processes sharing PORT through SO_REUSEPORT.
+
+    The database is initialized once before forking. The parent serves as
+    well; once it shuts down it forwards SIGTERM to the others and waits.
+
+    Args:
+        count: Total number of server processes
+    """
+    init_database()
+    # An SQLite handle must not be used on both sides of a fork
+    _close_thread_connection()
+
+    children = []
+    for _ in range(count - 1):
+        pid = os.fork()
+        if pid == 0:
+            _run_server(init_db=False)
+            os._exit(0)
+        children.append(pid)
+
+    logger.info(f"Started {count} server processes")
+    try:
+        _run_server(init_db=False)
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            os.waitpid(pid, 0)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if SERVER_PROCESSES > 1 and hasattr(os, "fork"):
+        _run_processes(SERVER_PROCESSES)
+    else:
+        _run_server()
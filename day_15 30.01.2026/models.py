@@ -5,7 +5,7 @@ Handles model definitions, validation, and selection logic.
 Provides a clean interface for model-related operations.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -20,6 +20,14 @@ class ModelInfo:
     output_price_per_1m: float
     # tiktoken encoding name for fallback token counting
     tiktoken_encoding: str
+    # Pricing per single token, derived from the per-1M prices
+    input_price_per_token: float = field(init=False, repr=False)
+    output_price_per_token: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen dataclass, so set derived fields through object.__setattr__
+        object.__setattr__(self, "input_price_per_token", self.input_price_per_1m / 1_000_000)
+        object.__setattr__(self, "output_price_per_token", self.output_price_per_1m / 1_000_000)
 
 
 # Supported models with their display information and pricing
@@ -14,9 +14,11 @@ Features:
 import asyncio
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Callable, Optional, Awaitable, Union, Dict
+from typing import Any, Callable, Optional, Awaitable, Union, Dict
 
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, JobEvent
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -28,6 +30,16 @@ logger = logging.getLogger(__name__)
 # Check which MCP mode to use
 USE_HTTP_MCP = os.getenv("USE_HTTP_MCP", "false").lower() == "true"
 
+# Email preferences change rarely, so reminder ticks reuse them for this long
+EMAIL_PREFS_TTL = 300.0
+
+# Reminders sent at once per tick (each stdio MCP call starts a server process)
+REMINDER_CONCURRENCY = 10
+
+# Seconds a tick may be delayed at random, so several bot instances don't hit
+# the MCP server together. Kept well under a minute so the tick's minute holds.
+TICK_JITTER = 5
+
 
 class ReminderScheduler:
     """
@@ -52,26 +64,34 @@ class ReminderScheduler:
         self._running = False
         self._mcp_client: Optional[Union[MCPHttpClient, TaskTrackerMCPClient]] = None
         self._use_http = USE_HTTP_MCP
+        # user_id -> (fetched_at monotonic, email preferences)
+        self._email_prefs: dict[str, tuple[float, Dict]] = {}
+        # Task reminder check started by the last tick, if still running
+        self._task_check: Optional[asyncio.Task] = None
 
     def _get_mcp_client(self) -> Union[MCPHttpClient, TaskTrackerMCPClient]:
         """Get the MCP client, with lazy initialization."""
-        if self._mcp_client is None:
-            if self._use_http:
-                self._mcp_client = get_mcp_http_client()
-            else:
-                self._mcp_client = get_task_tracker_client()
-        if self._mcp_client is None:
+        client = self._mcp_client
+        if client is not None:
+            return client
+
+        client = get_mcp_http_client() if self._use_http else get_task_tracker_client()
+        if client is None:
             client_type = "HTTP" if self._use_http else "Task Tracker"
             raise RuntimeError(f"MCP {client_type} client not initialized")
-        return self._mcp_client
+        self._mcp_client = client
+        return client
 
-    async def check_and_send_reminders(self) -> None:
+    async def check_and_send_reminders(self, now: Optional[datetime] = None) -> None:
         """
         Check for scheduled reminders and send them.
 
         This is called every minute by the scheduler.
+
+        Args:
+            now: Tick time shared with the task reminder check (default: now)
         """
-        now = datetime.now()
+        now = now or datetime.now()
         current_hour = now.hour
         current_minute = now.minute
 
@@ -80,76 +100,187 @@ class ReminderScheduler:
         try:
             mcp = self._get_mcp_client()
 
-            # Get users scheduled for this time
+            # The HTTP server prepares the whole tick in one call
             if self._use_http:
-                result = await mcp.get_scheduled_users(current_hour, current_minute)
-            else:
-                result = await mcp.call_tool("reminder_get_scheduled_users", {
-                    "hour": current_hour, "minute": current_minute
-                })
+                await self._send_reminder_batch(mcp, current_hour, current_minute)
+                return
+
+            # Summaries and email preferences for every scheduled user in one call
+            result = await mcp.call_tool("reminder_generate_scheduled_summaries", {
+                "hour": current_hour, "minute": current_minute, "include_completed": True
+            })
 
             if not result.success:
-                logger.error(f"Failed to get scheduled users: {result.error}")
+                logger.error(f"Failed to generate scheduled summaries: {result.error}")
                 return
 
-            users = result.data.get("users", [])
+            summaries = result.data.get("summaries", {})
 
-            if not users:
+            if not summaries:
                 return
 
-            logger.info(f"Sending reminders to {len(users)} users at {current_hour:02d}:{current_minute:02d}")
+            logger.info(f"Sending reminders to {len(summaries)} users at {current_hour:02d}:{current_minute:02d}")
 
-            # Send reminders to each user
-            for user_id in users:
-                await self._send_reminder_to_user(user_id)
+            # The email notifications read these from the cache
+            fetched_at = time.monotonic()
+            for user_id, prefs in result.data.get("preferences", {}).items():
+                self._email_prefs[user_id] = (fetched_at, prefs)
+
+            # Send reminders to the users concurrently, then mark them sent in one call
+            users = list(summaries)
+            delivered = await self._run_bounded(
+                lambda user_id: self._deliver_reminder(user_id, summaries[user_id]),
+                users
+            )
+            sent = [user_id for user_id, ok in zip(users, delivered) if ok]
+
+            if sent:
+                mark_result = await mcp.call_tool("reminder_mark_sent_bulk", {"user_ids": sent})
+                if not mark_result.success:
+                    logger.error(f"Failed to mark reminders sent: {mark_result.error}")
 
         except Exception as e:
             logger.error(f"Error in reminder check: {e}", exc_info=True)
 
-    async def _send_reminder_to_user(self, user_id: str) -> None:
+    async def _send_reminder_batch(self, mcp: MCPHttpClient, hour: int, minute: int) -> None:
         """
-        Generate and send a reminder to a specific user.
+        Send one tick's reminders through the HTTP server's batch tools.
 
-        Sends via Telegram and optionally via email if configured.
+        The server builds every summary and queues the emails in one call;
+        users reached on Telegram are then marked sent in one call.
 
         Args:
-            user_id: Telegram user ID
+            mcp: HTTP MCP client
+            hour: Current hour
+            minute: Current minute
         """
-        try:
-            mcp = self._get_mcp_client()
+        result = await mcp.run_reminder_batch(hour, minute, include_completed=True)
+        if not result.success:
+            logger.error(f"Failed to prepare reminders: {result.error}")
+            return
 
-            # Generate summary via MCP
-            if self._use_http:
-                result = await mcp.generate_summary(user_id, include_completed=True)
-            else:
-                result = await mcp.call_tool("reminder_generate_summary", {
-                    "user_id": user_id, "include_completed": True
-                })
+        summaries = result.data.get("summaries", {})
+        if not summaries:
+            return
 
-            if not result.success:
-                logger.error(f"Failed to generate summary for user {user_id}: {result.error}")
-                return
+        logger.info(f"Sending reminders to {len(summaries)} users at {hour:02d}:{minute:02d}")
 
-            summary = result.data.get("summary", "No summary available")
+        async def send(user_id: str) -> bool:
+            try:
+                if await self.send_message(user_id, summaries[user_id]):
+                    logger.info(f"Telegram reminder sent to user {user_id}")
+                    return True
+                logger.error(f"Failed to send Telegram reminder to user {user_id}")
+            except Exception as e:
+                logger.error(f"Error sending reminder to user {user_id}: {e}", exc_info=True)
+            return False
+
+        users = list(summaries)
+        delivered = await self._run_bounded(send, users)
+        sent = [user_id for user_id, ok in zip(users, delivered) if ok]
 
+        if sent:
+            mark_result = await mcp.mark_reminders_sent(sent)
+            if not mark_result.success:
+                logger.error(f"Failed to mark reminders sent: {mark_result.error}")
+
+    async def _deliver_reminder(self, user_id: str, summary: str) -> bool:
+        """
+        Send a reminder summary to a user.
+
+        Sends via Telegram and optionally via email if configured.
+
+        Args:
+            user_id: Telegram user ID
+            summary: Summary text to send
+
+        Returns:
+            True if the Telegram reminder was delivered
+        """
+        try:
             # Send via Telegram
             telegram_success = await self.send_message(user_id, summary)
 
             if telegram_success:
-                # Mark reminder as sent
-                if self._use_http:
-                    await mcp.mark_reminder_sent(user_id)
-                else:
-                    await mcp.call_tool("reminder_mark_sent", {"user_id": user_id})
                 logger.info(f"Telegram reminder sent to user {user_id}")
             else:
                 logger.error(f"Failed to send Telegram reminder to user {user_id}")
 
             # Send email notification if configured (non-blocking)
             await self._send_email_notification(user_id, summary)
+            return telegram_success
 
         except Exception as e:
             logger.error(f"Error sending reminder to user {user_id}: {e}", exc_info=True)
+            return False
+
+    async def _get_email_preferences(self, user_id: str) -> Optional[Dict]:
+        """
+        Get a user's email preferences, reusing a recent lookup.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Preferences dict, or None if the lookup failed
+        """
+        cached = self._email_prefs.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < EMAIL_PREFS_TTL:
+            return cached[1]
+
+        mcp = self._get_mcp_client()
+        if self._use_http:
+            result = await mcp.get_email_preferences(user_id)
+        else:
+            result = await mcp.call_tool("notification_get_email_preferences", {
+                "user_id": user_id
+            })
+
+        # Failed lookups are not cached so the next tick retries
+        if not result.success:
+            return None
+
+        self._email_prefs[user_id] = (time.monotonic(), result.data)
+        return result.data
+
+    async def _prefetch_email_preferences(self, user_ids: list[str]) -> None:
+        """
+        Cache email preferences for several users with one MCP call.
+
+        Users with a fresh cached entry are skipped. If the lookup fails, the
+        per-user lookups fetch the preferences when the emails are sent.
+
+        Args:
+            user_ids: User identifiers
+        """
+        now = time.monotonic()
+        missing = []
+        for user_id in dict.fromkeys(user_ids):
+            cached = self._email_prefs.get(user_id)
+            if cached is None or now - cached[0] >= EMAIL_PREFS_TTL:
+                missing.append(user_id)
+        if not missing:
+            return
+
+        mcp = self._get_mcp_client()
+        if self._use_http:
+            result = await mcp.get_email_preferences_bulk(missing)
+        else:
+            result = await mcp.call_tool("notification_get_email_preferences_bulk", {
+                "user_ids": missing
+            })
+
+        if not result.success:
+            logger.warning(f"Failed to prefetch email preferences: {result.error}")
+            return
+
+        fetched_at = time.monotonic()
+        for user_id, prefs in result.data.get("preferences", {}).items():
+            self._email_prefs[user_id] = (fetched_at, prefs)
+
+    def invalidate_email_prefs(self, user_id: str) -> None:
+        """Forget a user's cached email preferences after they change."""
+        self._email_prefs.pop(user_id, None)
 
     async def _send_email_notification(self, user_id: str, summary: str) -> None:
         """
@@ -165,27 +296,21 @@ class ReminderScheduler:
             mcp = self._get_mcp_client()
 
             # Check email preferences
-            if self._use_http:
-                prefs_result = await mcp.get_email_preferences(user_id)
-            else:
-                prefs_result = await mcp.call_tool("notification_get_email_preferences", {
-                    "user_id": user_id
-                })
-
-            if not prefs_result.success:
+            prefs = await self._get_email_preferences(user_id)
+            if prefs is None:
                 logger.debug(f"Could not get email preferences for user {user_id}")
                 return
 
-            email_enabled = prefs_result.data.get("email_enabled", False)
-            email_recipient = prefs_result.data.get("email_recipient")
+            email_enabled = prefs.get("email_enabled", False)
+            email_recipient = prefs.get("email_recipient")
 
             if not email_enabled or not email_recipient:
                 logger.debug(f"Email notifications not configured for user {user_id}")
                 return
 
-            # Send email via MCP
+            # Send email via MCP (the HTTP server delivers it in the background)
             if self._use_http:
-                email_result = await mcp.send_email(
+                email_result = await mcp.queue_email(
                     recipient_email=email_recipient,
                     subject="New Reminder",
                     message_text=summary
@@ -198,7 +323,8 @@ class ReminderScheduler:
                 })
 
             if email_result.success:
-                logger.info(f"Email reminder sent to user {user_id} ({email_recipient})")
+                status = "queued" if email_result.data.get("queued") else "sent"
+                logger.info(f"Email reminder {status} for user {user_id} ({email_recipient})")
             else:
                 logger.warning(f"Failed to send email to user {user_id}: {email_result.error}")
 
@@ -206,14 +332,17 @@ class ReminderScheduler:
             # Email failure should not break reminder flow
             logger.warning(f"Email notification failed for user {user_id}: {e}")
 
-    async def check_task_reminders(self) -> None:
+    async def check_task_reminders(self, now: Optional[datetime] = None) -> None:
         """
         Check for task-specific reminders that are due and send them.
 
         This is called every minute by the scheduler.
+
+        Args:
+            now: Tick time shared with the daily reminder check (default: now)
         """
-        now = datetime.now()
-        current_time_iso = now.strftime("%Y-%m-%dT%H:%M:%S")
+        now = now or datetime.now()
+        current_time_iso = now.isoformat(timespec="seconds")
 
         logger.debug(f"Checking task reminders at {current_time_iso}")
 
@@ -240,20 +369,33 @@ class ReminderScheduler:
 
             logger.info(f"Found {len(reminders)} due task reminders")
 
-            # Send each reminder
-            for reminder in reminders:
-                await self._send_task_reminder(reminder)
+            await self._prefetch_email_preferences([reminder["user_id"] for reminder in reminders])
+
+            # Send the reminders concurrently, then mark the delivered ones in one call
+            delivered = await self._run_bounded(self._send_task_reminder, reminders)
+            sent_ids = [reminder["id"] for reminder, ok in zip(reminders, delivered) if ok]
+
+            if sent_ids:
+                mark_result = await mcp.call_tool("task_reminder_mark_sent_bulk", {
+                    "reminder_ids": sent_ids
+                })
+                if not mark_result.success:
+                    logger.error(f"Failed to mark task reminders sent: {mark_result.error}")
 
         except Exception as e:
             logger.error(f"Error in task reminder check: {e}", exc_info=True)
 
-    async def _send_task_reminder(self, reminder: Dict) -> None:
+    async def _send_task_reminder(self, reminder: Dict) -> bool:
         """
         Send a task-specific reminder notification.
 
         Args:
             reminder: Reminder dict with task info
+
+        Returns:
+            True if the Telegram message was delivered
         """
+        success = False
         try:
             user_id = reminder["user_id"]
             task_id = reminder["task_id"]
@@ -263,26 +405,16 @@ class ReminderScheduler:
             reminder_id = reminder["id"]
 
             # Build Telegram message
-            message_lines = [
-                f"⏰ DO NOT FORGET - {task_title}",
-            ]
+            message = f"⏰ DO NOT FORGET - {task_title}"
             if task_description:
-                message_lines.append(f"\n{task_description}")
+                message += f"\n\n{task_description}"
             if custom_message:
-                message_lines.append(f"\n{custom_message}")
-
-            message = "\n".join(message_lines)
+                message += f"\n\n{custom_message}"
 
             # Send via Telegram
             success = await self.send_message(user_id, message)
 
             if success:
-                # Mark reminder as sent
-                mcp = self._get_mcp_client()
-                if not self._use_http:
-                    await mcp.call_tool("task_reminder_mark_sent", {
-                        "reminder_id": reminder_id
-                    })
                 logger.info(f"Task reminder {reminder_id} sent to user {user_id}")
             else:
                 logger.error(f"Failed to send task reminder {reminder_id} to user {user_id}")
@@ -293,6 +425,8 @@ class ReminderScheduler:
         except Exception as e:
             logger.error(f"Error sending task reminder: {e}", exc_info=True)
 
+        return success
+
     async def _send_task_email_notification(self, user_id: str, task_title: str,
                                             task_description: str = "") -> None:
         """
@@ -307,19 +441,13 @@ class ReminderScheduler:
             mcp = self._get_mcp_client()
 
             # Check email preferences
-            if self._use_http:
-                prefs_result = await mcp.get_email_preferences(user_id)
-            else:
-                prefs_result = await mcp.call_tool("notification_get_email_preferences", {
-                    "user_id": user_id
-                })
-
-            if not prefs_result.success:
+            prefs = await self._get_email_preferences(user_id)
+            if prefs is None:
                 logger.debug(f"Could not get email preferences for user {user_id}")
                 return
 
-            email_enabled = prefs_result.data.get("email_enabled", False)
-            email_recipient = prefs_result.data.get("email_recipient")
+            email_enabled = prefs.get("email_enabled", False)
+            email_recipient = prefs.get("email_recipient")
 
             if not email_enabled or not email_recipient:
                 logger.debug(f"Email notifications not configured for user {user_id}")
@@ -328,16 +456,13 @@ class ReminderScheduler:
             # Build email content
             subject = task_title
 
-            body_lines = [f"DO NOT FORGET - {task_title}"]
+            message_text = f"DO NOT FORGET - {task_title}"
             if task_description:
-                body_lines.append("")
-                body_lines.append(task_description)
+                message_text += f"\n\n{task_description}"
 
-            message_text = "\n".join(body_lines)
-
-            # Send email via MCP
+            # Send email via MCP (the HTTP server delivers it in the background)
             if self._use_http:
-                email_result = await mcp.send_email(
+                email_result = await mcp.queue_email(
                     recipient_email=email_recipient,
                     subject=subject,
                     message_text=message_text
@@ -350,7 +475,8 @@ class ReminderScheduler:
                 })
 
             if email_result.success:
-                logger.info(f"Task email sent to user {user_id} ({email_recipient}): {task_title}")
+                status = "queued" if email_result.data.get("queued") else "sent"
+                logger.info(f"Task email {status} for user {user_id} ({email_recipient}): {task_title}")
             else:
                 logger.warning(f"Failed to send task email to user {user_id}: {email_result.error}")
 
@@ -389,28 +515,78 @@ class ReminderScheduler:
             logger.error(error_msg, exc_info=True)
             return False, error_msg
 
+    async def _run_bounded(self, send: Callable[[Any], Awaitable[bool]],
+                           items: list) -> list[bool]:
+        """
+        Run send over items with at most REMINDER_CONCURRENCY in flight.
+
+        Args:
+            send: Coroutine function returning True on delivery; must not raise
+            items: Items to send
+
+        Returns:
+            Delivery results in the order of items
+        """
+        semaphore = asyncio.Semaphore(REMINDER_CONCURRENCY)
+
+        async def bounded(item: Any) -> bool:
+            async with semaphore:
+                return await send(item)
+
+        return await asyncio.gather(*(bounded(item) for item in items))
+
+    async def _tick(self) -> None:
+        """Start the task reminder check, then run the daily reminder check."""
+        # Both checks see the same tick time
+        now = datetime.now()
+        # The task check runs on its own so a slow batch never holds the tick
+        # past the next minute; if it would, APScheduler drops that tick and
+        # users scheduled for its exact minute miss their daily summary.
+        # Due task reminders stay due, so a skipped task check loses nothing.
+        if self._task_check is None or self._task_check.done():
+            self._task_check = asyncio.create_task(self.check_task_reminders(now))
+        else:
+            logger.warning(f"Task reminder check for {now:%H:%M} skipped; previous check still running")
+        await self.check_and_send_reminders(now)
+
+    def _on_tick_skipped(self, event: JobEvent) -> None:
+        """Log ticks that were missed or dropped while the previous one still ran."""
+        if event.code == EVENT_JOB_MISSED:
+            logger.warning(
+                f"Reminder tick for {event.scheduled_run_time} missed its grace time; skipped"
+            )
+        else:
+            logger.warning(
+                f"Reminder tick for {event.scheduled_run_times[-1]} skipped; previous tick still running"
+            )
+
     def start(self) -> None:
         """Start the scheduler."""
         if self._running:
             logger.warning("Scheduler already running")
             return
 
-        # Schedule the daily reminder check to run every minute
+        # Resolve the MCP client up front so reminder paths only read the attribute
+        try:
+            self._get_mcp_client()
+        except RuntimeError as e:
+            logger.warning(f"{e}; retrying on the first reminder check")
+
+        # One tick per minute runs the daily check and starts the task check.
+        # A late tick is coalesced rather than run twice, and never overlaps itself.
         self.scheduler.add_job(
-            self.check_and_send_reminders,
-            CronTrigger(minute="*"),  # Every minute
-            id="reminder_check",
-            name="Check and send daily reminders",
-            replace_existing=True
+            self._tick,
+            CronTrigger(minute="*", jitter=TICK_JITTER),  # Every minute
+            id="reminder_tick",
+            name="Check and send daily and task reminders",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=30
         )
 
-        # Schedule task-specific reminder check to run every minute
-        self.scheduler.add_job(
-            self.check_task_reminders,
-            CronTrigger(minute="*"),  # Every minute
-            id="task_reminder_check",
-            name="Check and send task reminders",
-            replace_existing=True
+        self.scheduler.add_listener(
+            self._on_tick_skipped, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
         )
 
         self.scheduler.start()
@@ -423,6 +599,8 @@ class ReminderScheduler:
             return
 
         self.scheduler.shutdown(wait=False)
+        if self._task_check is not None and not self._task_check.done():
+            self._task_check.cancel()
         self._running = False
         logger.info("Reminder scheduler stopped")
 
@@ -468,3 +646,9 @@ def stop_scheduler() -> None:
     """Stop the global scheduler."""
     if _scheduler:
         _scheduler.stop()
+
+
+def invalidate_email_prefs(user_id: str) -> None:
+    """Drop the global scheduler's cached email preferences for a user."""
+    if _scheduler:
+        _scheduler.invalidate_email_prefs(user_id)
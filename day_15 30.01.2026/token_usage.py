@@ -5,6 +5,7 @@ Provides token counting (from API response or fallback tiktoken estimation)
 and cost calculation based on model pricing.
 """
 
+import functools
 import logging
 from dataclasses import dataclass
 from typing import Optional
@@ -15,6 +16,19 @@ from models import get_model_info, ModelInfo
 
 logger = logging.getLogger(__name__)
 
+# Telegram message layout for format_usage_report
+_REPORT_FMT = (
+    "**Token Usage** ({model_name}, {source}):\n"
+    "  Input: {input_tokens:,} tokens\n"
+    "  Output: {output_tokens:,} tokens\n"
+    "  Total: {total_tokens:,} tokens\n"
+    "\n"
+    "**Cost (USD):**\n"
+    "  Input: {cost_input}\n"
+    "  Output: {cost_output}\n"
+    "  Total: {cost_total}"
+)
+
 
 @dataclass
 class TokenUsage:
@@ -42,6 +56,8 @@ class UsageReport:
     usage: TokenUsage
     cost: UsageCost
     model_id: str
+    # Looked up once in get_usage_report and reused when formatting
+    model_info: Optional[ModelInfo] = None
 
 
 def extract_usage_from_response(response) -> Optional[TokenUsage]:
@@ -70,6 +86,19 @@ def extract_usage_from_response(response) -> Optional[TokenUsage]:
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once and reuse it across calls."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+# Pre-warm the default encoding so the first request doesn't pay the load cost
+try:
+    _get_encoding("cl100k_base")
+except Exception as e:
+    logger.warning(f"Could not pre-load tiktoken encoding: {e}")
+
+
 def count_tokens_locally(
     text: str,
     encoding_name: str = "cl100k_base"
@@ -85,8 +114,7 @@ def count_tokens_locally(
         Token count
     """
     try:
-        encoding = tiktoken.get_encoding(encoding_name)
-        return len(encoding.encode(text))
+        return len(_get_encoding(encoding_name).encode_ordinary(text))
     except Exception as e:
         logger.error(f"Error counting tokens with tiktoken: {e}")
         # Rough estimation as last resort: ~4 characters per token
@@ -109,11 +137,29 @@ def estimate_usage_locally(
     Returns:
         TokenUsage with estimated counts
     """
-    model_info = get_model_info(model_id)
+    return _estimate_usage_locally(input_text, output_text, get_model_info(model_id))
+
+
+def _estimate_usage_locally(
+    input_text: str,
+    output_text: str,
+    model_info: Optional[ModelInfo]
+) -> TokenUsage:
+    """Estimate token usage for an already looked-up model."""
     encoding_name = model_info.tiktoken_encoding if model_info else "cl100k_base"
 
-    input_tokens = count_tokens_locally(input_text, encoding_name)
-    output_tokens = count_tokens_locally(output_text, encoding_name)
+    try:
+        # One batched call instead of two separate encodes
+        input_ids, output_ids = _get_encoding(encoding_name).encode_ordinary_batch(
+            [input_text, output_text]
+        )
+        input_tokens = len(input_ids)
+        output_tokens = len(output_ids)
+    except Exception as e:
+        logger.error(f"Error counting tokens with tiktoken: {e}")
+        # Rough estimation as last resort: ~4 characters per token
+        input_tokens = len(input_text) // 4
+        output_tokens = len(output_text) // 4
 
     return TokenUsage(
         input_tokens=input_tokens,
@@ -138,6 +184,13 @@ def calculate_cost(usage: TokenUsage, model_id: str) -> UsageCost:
 
     if model_info is None:
         logger.warning(f"No pricing info for model {model_id}, costs set to 0")
+
+    return _calculate_cost(usage, model_info)
+
+
+def _calculate_cost(usage: TokenUsage, model_info: Optional[ModelInfo]) -> UsageCost:
+    """Calculate cost for an already looked-up model."""
+    if model_info is None:
         return UsageCost(
             input_cost=0.0,
             output_cost=0.0,
@@ -145,9 +198,9 @@ def calculate_cost(usage: TokenUsage, model_id: str) -> UsageCost:
             pricing_available=False
         )
 
-    # Cost formula: (tokens / 1_000_000) * price_per_1M
-    input_cost = (usage.input_tokens / 1_000_000) * model_info.input_price_per_1m
-    output_cost = (usage.output_tokens / 1_000_000) * model_info.output_price_per_1m
+    # Cost formula: tokens * price_per_token (price_per_1M / 1_000_000)
+    input_cost = usage.input_tokens * model_info.input_price_per_token
+    output_cost = usage.output_tokens * model_info.output_price_per_token
     total_cost = input_cost + output_cost
 
     return UsageCost(
@@ -178,6 +231,9 @@ def get_usage_report(
     Returns:
         UsageReport with usage and cost data
     """
+    # Look the model up once for both estimation and pricing
+    model_info = get_model_info(model_id)
+
     # Try to get usage from API response first
     usage = None
     if response is not None:
@@ -185,16 +241,19 @@ def get_usage_report(
 
     # Fall back to local estimation if API usage not available
     if usage is None:
-        usage = estimate_usage_locally(input_text, output_text, model_id)
+        usage = _estimate_usage_locally(input_text, output_text, model_info)
         logger.info(f"Using local token estimation for model {model_id}")
 
     # Calculate cost
-    cost = calculate_cost(usage, model_id)
+    if model_info is None:
+        logger.warning(f"No pricing info for model {model_id}, costs set to 0")
+    cost = _calculate_cost(usage, model_info)
 
     return UsageReport(
         usage=usage,
         cost=cost,
-        model_id=model_id
+        model_id=model_id,
+        model_info=model_info
     )
 
 
@@ -208,7 +267,7 @@ def format_usage_report(report: UsageReport) -> str:
     Returns:
         Formatted string for Telegram
     """
-    model_info = get_model_info(report.model_id)
+    model_info = report.model_info or get_model_info(report.model_id)
     model_name = model_info.display_name if model_info else report.model_id
 
     # Token source indicator
@@ -220,20 +279,15 @@ def format_usage_report(report: UsageReport) -> str:
         cost_output = f"${report.cost.output_cost:.6f}"
         cost_total = f"${report.cost.total_cost:.6f}"
     else:
-        cost_input = "N/A (price unknown)"
-        cost_output = "N/A (price unknown)"
-        cost_total = "N/A (price unknown)"
-
-    lines = [
-        f"**Token Usage** ({model_name}, {source}):",
-        f"  Input: {report.usage.input_tokens:,} tokens",
-        f"  Output: {report.usage.output_tokens:,} tokens",
-        f"  Total: {report.usage.total_tokens:,} tokens",
-        "",
-        "**Cost (USD):**",
-        f"  Input: {cost_input}",
-        f"  Output: {cost_output}",
-        f"  Total: {cost_total}",
-    ]
-
-    return "\n".join(lines)
+        cost_input = cost_output = cost_total = "N/A (price unknown)"
+
+    return _REPORT_FMT.format(
+        model_name=model_name,
+        source=source,
+        input_tokens=report.usage.input_tokens,
+        output_tokens=report.usage.output_tokens,
+        total_tokens=report.usage.total_tokens,
+        cost_input=cost_input,
+        cost_output=cost_output,
+        cost_total=cost_total
+    )
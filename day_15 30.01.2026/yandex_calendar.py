@@ -5,7 +5,7 @@ This module provides functionality to add tasks as events to Yandex Calendar
 using the CalDAV protocol.
 
 Requirements:
-    pip install caldav
+    pip install caldav icalendar
 
 Setup:
     1. Go to https://id.yandex.ru/security/app-passwords
@@ -15,7 +15,9 @@ Setup:
        - yandex_calendar_password = "your-app-password"
 """
 
+import asyncio
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
@@ -23,6 +25,7 @@ from dataclasses import dataclass
 try:
     import caldav
     from caldav.elements import dav
+    from icalendar import Calendar, Event
     CALDAV_AVAILABLE = True
 except ImportError:
     CALDAV_AVAILABLE = False
@@ -32,6 +35,16 @@ logger = logging.getLogger(__name__)
 # Yandex CalDAV endpoint
 YANDEX_CALDAV_URL = "https://caldav.yandex.ru/"
 
+# VCALENDAR wrapper shared by every event, copied per add_event call
+if CALDAV_AVAILABLE:
+    _CAL_TEMPLATE = Calendar()
+    _CAL_TEMPLATE.add('prodid', '-//Telegram Bot//Task Tracker//EN')
+    _CAL_TEMPLATE.add('version', '2.0')
+
+# Time window searched when deleting a task event without a known href
+TASK_EVENT_SEARCH_PAST = timedelta(days=30)
+TASK_EVENT_SEARCH_FUTURE = timedelta(days=365)
+
 
 @dataclass
 class CalendarEvent:
@@ -48,6 +61,7 @@ class CalendarResult:
     """Result of calendar operation."""
     success: bool
     event_uid: Optional[str] = None
+    event_url: Optional[str] = None
     error: Optional[str] = None
 
 
@@ -74,6 +88,31 @@ class YandexCalendarClient:
         self._client = None
         self._principal = None
         self._default_calendar = None
+        # Guards _connect so concurrent calls share one DAV session
+        self._lock = threading.Lock()
+        # Event hrefs of tasks added by this client, keyed by task title
+        self._task_event_urls: dict[str, str] = {}
+
+    def _ensure_connected(self) -> bool:
+        """Connect once and reuse the DAV session for later calls."""
+        if self._default_calendar is not None:
+            return True
+        with self._lock:
+            if self._default_calendar is not None:
+                return True
+            return self._connect()
+
+    def close(self) -> None:
+        """Close the underlying DAV session."""
+        with self._lock:
+            if self._client is not None:
+                try:
+                    self._client.close()
+                except Exception as e:
+                    logger.warning(f"Error closing Yandex Calendar session: {e}")
+            self._client = None
+            self._principal = None
+            self._default_calendar = None
 
     def _connect(self) -> bool:
         """Establish connection to Yandex CalDAV server."""
@@ -111,12 +150,11 @@ class YandexCalendarClient:
         """
         try:
             # Ensure connection
-            if self._default_calendar is None:
-                if not self._connect():
-                    return CalendarResult(
-                        success=False,
-                        error="Failed to connect to Yandex Calendar"
-                    )
+            if not self._ensure_connected():
+                return CalendarResult(
+                    success=False,
+                    error="Failed to connect to Yandex Calendar"
+                )
 
             # Set default times if not provided
             if event.start_time is None:
@@ -130,37 +168,22 @@ class YandexCalendarClient:
                     # Default 1 hour duration
                     event.end_time = event.start_time + timedelta(hours=1)
 
-            # Build iCalendar event
+            # Build iCalendar event (icalendar handles RFC 5545 escaping)
+            vevent = Event()
+            vevent.add('summary', event.title)
+            vevent.add('description', event.description or '')
             if event.all_day:
-                # Format for all-day event (DATE only, no time)
-                dtstart = event.start_time.strftime("%Y%m%d")
-                dtend = event.end_time.strftime("%Y%m%d")
-                vcal = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Telegram Bot//Task Tracker//EN
-BEGIN:VEVENT
-DTSTART;VALUE=DATE:{dtstart}
-DTEND;VALUE=DATE:{dtend}
-SUMMARY:{event.title}
-DESCRIPTION:{event.description or ''}
-STATUS:CONFIRMED
-END:VEVENT
-END:VCALENDAR"""
+                # All-day event: DATE values, no time
+                vevent.add('dtstart', event.start_time.date())
+                vevent.add('dtend', event.end_time.date())
             else:
-                # Format for timed event
-                dtstart = event.start_time.strftime("%Y%m%dT%H%M%S")
-                dtend = event.end_time.strftime("%Y%m%dT%H%M%S")
-                vcal = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Telegram Bot//Task Tracker//EN
-BEGIN:VEVENT
-DTSTART:{dtstart}
-DTEND:{dtend}
-SUMMARY:{event.title}
-DESCRIPTION:{event.description or ''}
-STATUS:CONFIRMED
-END:VEVENT
-END:VCALENDAR"""
+                vevent.add('dtstart', event.start_time)
+                vevent.add('dtend', event.end_time)
+            vevent.add('status', 'CONFIRMED')
+
+            cal = _CAL_TEMPLATE.copy()
+            cal.add_component(vevent)
+            vcal = cal.to_ical().decode()
 
             # Create event in calendar
             created_event = self._default_calendar.save_event(vcal)
@@ -172,11 +195,14 @@ END:VCALENDAR"""
                 if vevent is not None and hasattr(vevent, 'uid'):
                     event_uid = str(vevent.uid.value)
 
+            event_url = str(created_event.url) if getattr(created_event, 'url', None) else None
+
             logger.info(f"Created calendar event: {event.title} (UID: {event_uid})")
 
             return CalendarResult(
                 success=True,
-                event_uid=event_uid
+                event_uid=event_uid,
+                event_url=event_url
             )
 
         except Exception as e:
@@ -215,7 +241,10 @@ END:VCALENDAR"""
                 all_day=True
             )
 
-        return self.add_event(event)
+        result = self.add_event(event)
+        if result.success and result.event_url:
+            self._task_event_urls[task_title] = result.event_url
+        return result
 
     def delete_task_event(self, task_title: str) -> CalendarResult:
         """
@@ -229,25 +258,34 @@ END:VCALENDAR"""
         """
         try:
             # Ensure connection
-            if self._default_calendar is None:
-                if not self._connect():
-                    return CalendarResult(
-                        success=False,
-                        error="Failed to connect to Yandex Calendar"
-                    )
+            if not self._ensure_connected():
+                return CalendarResult(
+                    success=False,
+                    error="Failed to connect to Yandex Calendar"
+                )
 
             # Search for events with the task title
             search_title = f"[Task] {task_title}"
             logger.info(f"Searching for calendar event: {search_title}")
 
-            # Try to search by text first (more efficient)
-            try:
-                events = self._default_calendar.search(summary=task_title)
-                if not events:
-                    events = self._default_calendar.events()
-            except Exception:
-                # Fallback to getting all events
-                events = self._default_calendar.events()
+            # Delete by stored href when this client created the event
+            event_url = self._task_event_urls.pop(task_title, None)
+            if event_url is not None:
+                try:
+                    self._default_calendar.event_by_url(event_url).delete()
+                    logger.info(f"Deleted calendar event: {search_title}")
+                    return CalendarResult(success=True)
+                except Exception as e:
+                    logger.warning(f"Could not delete event by href, searching instead: {e}")
+
+            # Server-side summary filter over a bounded time range
+            now = datetime.now()
+            events = self._default_calendar.search(
+                event=True,
+                summary=search_title,
+                start=now - TASK_EVENT_SEARCH_PAST,
+                end=now + TASK_EVENT_SEARCH_FUTURE
+            )
 
             deleted_count = 0
             events_checked = 0
@@ -255,8 +293,8 @@ END:VCALENDAR"""
             for event in events:
                 events_checked += 1
                 try:
-                    # Try to load event data if needed
-                    if hasattr(event, 'load') and callable(event.load):
+                    # Search results usually carry the data; load only if missing
+                    if not getattr(event, 'data', None) and callable(getattr(event, 'load', None)):
                         try:
                             event.load()
                         except Exception:
@@ -346,6 +384,12 @@ def get_yandex_calendar() -> Optional[YandexCalendarClient]:
     return _calendar_client
 
 
+def close_yandex_calendar() -> None:
+    """Close the global Yandex Calendar client's session."""
+    if _calendar_client is not None:
+        _calendar_client.close()
+
+
 def is_calendar_enabled() -> bool:
     """Check if Yandex Calendar is enabled and configured."""
     return _calendar_client is not None
@@ -372,7 +416,10 @@ async def add_task_to_calendar(task_title: str, task_description: Optional[str]
             error="Yandex Calendar not configured"
         )
 
-    return client.add_task_as_event(task_title, task_description, reminder_time)
+    # CalDAV calls block, so run them on the loop's shared default executor
+    return await asyncio.get_running_loop().run_in_executor(
+        None, client.add_task_as_event, task_title, task_description, reminder_time
+    )
 
 
 async def delete_task_from_calendar(task_title: str) -> CalendarResult:
@@ -393,4 +440,6 @@ async def delete_task_from_calendar(task_title: str) -> CalendarResult:
             error="Yandex Calendar not configured"
         )
 
-    return client.delete_task_event(task_title)
+    return await asyncio.get_running_loop().run_in_executor(
+        None, client.delete_task_event, task_title
+    )